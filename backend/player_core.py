@@ -1,23 +1,89 @@
 """Backend player core and playback/session logic."""
 
+import asyncio
+import atexit
+import concurrent.futures
+import contextlib
 import json
+import logging
+import math
 import os
 import random
+import re
 import subprocess
 import sys
 import threading
 import time
 import webbrowser
 import ctypes
+from collections import deque
+from dataclasses import replace
 from typing import Optional
 
 import pyautogui
 import pygetwindow as gw
 
-from backend.services.spotify_playlist import SpotifyPlaylist
+from backend.services.chrome_devtools import ChromeDevTools
+from backend.services.spotify_playlist import (
+	PLAYLIST_ITEMS_FIELDS,
+	PLAYLIST_ITEMS_PAGE_SIZE,
+	SpotifyPlaylist,
+	build_spotify_client,
+	call_with_backoff,
+)
+from backend.services.track_cache import TrackCache
 from backend.services.youtube_playlist import YouTubePlaylist
 from models import Track
 
+log = logging.getLogger(__name__)
+
+# pyautogui sleeps PAUSE seconds after every call; the automation sequences
+# below schedule their own waits instead. The failsafe (mouse in a corner
+# aborts) would fire on fullscreen clicks, so it stays off.
+pyautogui.PAUSE = 0
+pyautogui.FAILSAFE = False
+
+# Multiplier applied to every automation wait; raise it on slow machines
+AUTOMATION_DELAY_SCALE = 1.0
+
+# Browser windows are recognised by title keyword or by owning process name
+_BROWSER_TITLE_RE = re.compile(r"chrome|edge|firefox|brave|opera", re.IGNORECASE)
+_BROWSER_PROCESSES = frozenset({"chrome.exe", "msedge.exe", "firefox.exe", "brave.exe", "opera.exe"})
+
+# Playlist id in an open.spotify.com/playlist/<id> URL
+_SPOTIFY_PLAYLIST_RE = re.compile(r"playlist/([a-zA-Z0-9]+)")
+
+MOUSEEVENTF_LEFTDOWN = 0x0002
+MOUSEEVENTF_LEFTUP = 0x0004
+INPUT_MOUSE = 0
+CLR_INVALID = 0xFFFFFFFF
+
+
+class _MOUSEINPUT(ctypes.Structure):
+	_fields_ = (
+		("dx", ctypes.c_long),
+		("dy", ctypes.c_long),
+		("mouseData", ctypes.c_ulong),
+		("dwFlags", ctypes.c_ulong),
+		("time", ctypes.c_ulong),
+		("dwExtraInfo", ctypes.c_void_p),
+	)
+
+
+class _INPUT(ctypes.Structure):
+	# MOUSEINPUT is the largest member of the Win32 INPUT union, so sizeof() matches.
+	_fields_ = (("type", ctypes.c_ulong), ("mi", _MOUSEINPUT))
+
+
+def _delay(seconds: float):
+	"""Wait between automation steps, scaled by AUTOMATION_DELAY_SCALE."""
+	time.sleep(seconds * AUTOMATION_DELAY_SCALE)
+
+
+async def _adelay(seconds: float):
+	"""Coroutine form of `_delay`."""
+	await asyncio.sleep(seconds * AUTOMATION_DELAY_SCALE)
+
 
 class RandomPlayer:
 	"""Main player that randomly selects and plays content."""
@@ -26,35 +92,70 @@ class RandomPlayer:
 		self.youtube_tracks: list[Track] = []
 		self.spotify_tracks: list[Track] = []
 		self.all_tracks: list[Track] = []
-		self.played_tracks: list[Track] = []
+		# URLs of all_tracks, rebound together with it; used for refresh diffs
+		self._all_urls: set[str] = set()
+		# URL fingerprint of the last fetched (YouTube, Spotify) lists
+		self._last_fetch_sig: Optional[tuple[frozenset, frozenset]] = None
+		# Resolve YouTube durations missing from the flat listing (autoplay needs them);
+		# shared by the startup load and the silent refresh
+		self._resolve_youtube_durations: bool = True
+		# Recent play history; bounded so long sessions don't grow it forever
+		self.played_tracks: deque[Track] = deque(maxlen=10000)
 		self.current_browser_process: Optional[subprocess.Popen] = None
 		self.current_platform: Optional[str] = None
 
 		# Playlist refresh settings
 		self._refresh_thread: Optional[threading.Thread] = None
 		self._stop_refresh = threading.Event()
+		# Guards in-place edits of self._queue. The track lists (all_tracks,
+		# youtube_tracks, spotify_tracks) are never mutated in place: the
+		# refresher builds new lists and rebinds the attributes, so readers
+		# can use them without locking.
 		self._playlist_lock = threading.Lock()
 		self._youtube_url: str = ""
 		self._spotify_url: str = ""
 		self._spotify_client_id: str = ""
 		self._spotify_client_secret: str = ""
+		# Client-credentials Spotify client reused across refreshes, keyed by credentials
+		self._spotify_catalog_api = None
+		self._spotify_catalog_creds: tuple[str, str] = ("", "")
 		self.refresh_interval: int = 10  # seconds
+		# Unchanged refreshes back off exponentially up to this many seconds
+		self.refresh_max_interval: int = 120
 		self._youtube_playing: bool = False
 		self._spotify_playing: bool = False
 		self._current_track_title: Optional[str] = None
-		# play counts keyed by track identifier
+		# play counts keyed by track identifier. Single writer (the playback
+		# path) mutates single keys in place; bulk updates rebind a new dict.
 		self.play_counts: dict[str, int] = {}
-		# autoplay timer
-		self._autoplay_timer: Optional[threading.Timer] = None
+		# Play counts are flushed to disk in the background; set when unsaved changes exist
+		self._play_counts_dirty: bool = False
+		self._play_counts_flush_interval: float = 5.0
+		self._stop_play_counts_flush = threading.Event()
+		# Serialises flushes from the background thread, stop_auto_refresh and atexit (they share one temp file)
+		self._play_counts_save_lock = threading.Lock()
+		# Pending autoplay callback scheduled on the player loop; cancel() drops it
+		self._autoplay_timer: Optional[concurrent.futures.Future] = None
 		# Autoplay timer bookkeeping for pause/resume
 		self._autoplay_start_time: Optional[float] = None
 		self._autoplay_duration: Optional[float] = None
 		self._autoplay_remaining: Optional[float] = None
 		self._autoplay_paused: bool = False
 		# queue for upcoming tracks
-		self._queue: list[Track] = []
+		self._queue: deque[Track] = deque()
+		# Tracks drawn per automatic refill when the queue runs dry
+		self._queue_refill_batch: int = 50
 		# Next Up window handle (optional)
 		self._next_up_window = None
+		# Screen device context for GetPixel reads (lazily acquired, Windows only)
+		self._screen_dc: Optional[int] = None
+		# Recently scanned browser windows: (monotonic timestamp, windows)
+		self._window_cache: tuple[float, list[gw.Window]] = (0.0, [])
+		# Browser window last used for playback/VR; reused while it is still open
+		self._last_browser_hwnd: Optional[int] = None
+		# Optional DevTools connection (CHROME_REMOTE_DEBUGGING_PORT) and the id of the tab it opened
+		self._devtools: Optional[ChromeDevTools] = ChromeDevTools.from_env()
+		self._current_tab_id: Optional[str] = None
 		# Whether to show who added tracks in the Next Up window
 		self._show_adder_nextup = False
 		# Optional Demucs live mix slider integration for the main menu UI.
@@ -77,10 +178,38 @@ class RandomPlayer:
 			"youtube_last": (1640, 640),
 			"youtube_extra": (1643, 20),
 		}
+		# Event loop thread that runs the timed playback/VR automation sequences,
+		# so their waits are awaits rather than blocked threads
+		self._loop = asyncio.new_event_loop()
+		self._loop_thread = threading.Thread(target=self._loop.run_forever, name="player-loop", daemon=True)
+		self._loop_thread.start()
+		# Serializes keyboard/mouse sequences so two never interleave at an await
+		self._automation_lock = asyncio.Lock()
+		# Track metadata cache shared by the playlist providers
+		self._track_cache = TrackCache(self._track_cache_path())
 		# Load persisted play counts from disk if present
 		self._load_play_counts()
 		# Load persisted VR calibration if present
 		self._load_vr_points()
+		# Coalesce play count writes: a crash loses at most one flush interval of counts
+		threading.Thread(target=self._play_counts_flush_loop, daemon=True).start()
+		atexit.register(self._flush_play_counts)
+
+	def submit_coro(self, coro) -> concurrent.futures.Future:
+		"""Schedule a coroutine on the player loop from any thread."""
+		return asyncio.run_coroutine_threadsafe(coro, self._loop)
+
+	async def _locked(self, coro):
+		"""Await `coro` while holding the automation lock."""
+		async with self._automation_lock:
+			return await coro
+
+	def _run_automation(self, coro):
+		"""Run an automation coroutine on the player loop and wait for its result."""
+		if threading.current_thread() is self._loop_thread:
+			coro.close()
+			raise RuntimeError("blocking automation call made from the player loop thread")
+		return self.submit_coro(self._locked(coro)).result()
 
 	def _project_root(self) -> str:
 		return os.path.dirname(os.path.dirname(__file__))
@@ -88,40 +217,81 @@ class RandomPlayer:
 	def _play_counts_path(self) -> str:
 		return os.path.join(self._project_root(), "play_counts.json")
 
+	def _track_cache_path(self) -> str:
+		return os.path.join(self._project_root(), "track_cache.json")
+
+	def _read_json_file(self, path: str):
+		"""Return the parsed JSON at `path`, or None if it is missing.
+
+		A file that fails to parse is moved aside to `<path>.corrupt` so the
+		next save starts from a clean file instead of failing again.
+		"""
+		if not os.path.exists(path):
+			return None
+		try:
+			with open(path, "r", encoding="utf-8") as f:
+				return json.load(f)
+		except ValueError as exc:
+			backup = path + ".corrupt"
+			os.replace(path, backup)
+			log.warning("%s is corrupt (%s); moved to %s", os.path.basename(path), exc, backup)
+			return None
+
 	def _load_play_counts(self):
 		"""Load play counts from JSON file into self.play_counts."""
-		path = self._play_counts_path()
-		if not os.path.exists(path):
-			return
-		with open(path, "r", encoding="utf-8") as f:
-			data = json.load(f)
+		data = self._read_json_file(self._play_counts_path())
 		if not isinstance(data, dict):
 			return
 
-		for k, v in data.items():
-			try:
-				self.play_counts[str(k)] = int(v)
-			except (TypeError, ValueError):
-				self.play_counts[str(k)] = 0
+		# Entries that are not integral counts are dropped (equivalent to a count of 0)
+		counts = {
+			str(k): int(v)
+			for k, v in data.items()
+			if (isinstance(v, int) and not isinstance(v, bool))
+			or (isinstance(v, float) and math.isfinite(v))
+			or (isinstance(v, str) and v.strip().removeprefix("-").isdecimal())
+		}
+		self.play_counts = {**self.play_counts, **counts}
 
-	def _save_play_counts(self):
-		"""Atomically save play_counts to JSON on disk."""
-		path = self._play_counts_path()
+	def _write_json_atomic(self, path: str, data):
+		"""Write `data` as JSON to a temp file, fsync it, then os.replace over `path`."""
+		buf = json.dumps(data, ensure_ascii=False).encode("utf-8")
 		tmp = path + ".tmp"
-		with open(tmp, "w", encoding="utf-8") as f:
-			json.dump(self.play_counts, f, indent=2, ensure_ascii=False)
+		# Buffered write() retries short writes, so the whole payload lands before the fsync
+		with open(tmp, "wb") as f:
+			f.write(buf)
+			f.flush()
+			os.fsync(f.fileno())
 		os.replace(tmp, path)
 
+	def _save_play_counts(self):
+		"""Atomically save play_counts to JSON on disk."""
+		self._write_json_atomic(self._play_counts_path(), dict(self.play_counts))
+
+	def _flush_play_counts(self):
+		"""Save play_counts if they changed since the last save."""
+		with self._play_counts_save_lock:
+			if not self._play_counts_dirty:
+				return
+			# Clear first so increments made during the write mark it dirty again
+			self._play_counts_dirty = False
+			try:
+				self._save_play_counts()
+			except OSError as exc:
+				self._play_counts_dirty = True
+				log.warning("Failed to save play counts: %s", exc)
+
+	def _play_counts_flush_loop(self):
+		"""Background thread that periodically flushes dirty play counts."""
+		while not self._stop_play_counts_flush.wait(self._play_counts_flush_interval):
+			self._flush_play_counts()
+
 	def _vr_points_path(self) -> str:
 		return os.path.join(self._project_root(), "vr_calibration.json")
 
 	def _load_vr_points(self):
 		"""Load VR calibration points from JSON file into self._vr_points."""
-		path = self._vr_points_path()
-		if not os.path.exists(path):
-			return
-		with open(path, "r", encoding="utf-8") as f:
-			data = json.load(f)
+		data = self._read_json_file(self._vr_points_path())
 		if not isinstance(data, dict):
 			return
 		base = data.get("base")
@@ -143,8 +313,6 @@ class RandomPlayer:
 
 	def _save_vr_points(self):
 		"""Atomically save vr calibration to JSON on disk."""
-		path = self._vr_points_path()
-		tmp = path + ".tmp"
 		out = {}
 		b = self._vr_points.get("base", [])
 		if isinstance(b, (list, tuple)) and len(b) >= 2:
@@ -155,9 +323,7 @@ class RandomPlayer:
 			v = self._vr_points.get(key)
 			if isinstance(v, (list, tuple)) and len(v) >= 2:
 				out[key] = [int(v[0]), int(v[1])]
-		with open(tmp, "w", encoding="utf-8") as f:
-			json.dump(out, f, indent=2, ensure_ascii=False)
-		os.replace(tmp, path)
+		self._write_json_atomic(self._vr_points_path(), out)
 
 	def get_demucs_mix_controller(self):
 		"""Return a shared StemMixController instance for live voice-mix UI."""
@@ -285,10 +451,8 @@ class RandomPlayer:
 				print(f"[demucs-live] failed: {exc}")
 			finally:
 				if com_initialized and ole32 is not None:
-					try:
+					with contextlib.suppress(Exception):
 						ole32.CoUninitialize()
-					except Exception:
-						pass
 				with self._demucs_live_lock:
 					self._demucs_live_harness = None
 					self._demucs_live_thread = None
@@ -309,43 +473,124 @@ class RandomPlayer:
 		if thread is not None and thread.is_alive():
 			thread.join(timeout=2.0)
 
-	def _focus_tab_by_title(self, search_title: str) -> Optional[gw.Window]:
-		"""Find and focus a browser tab containing the track title."""
+	def _browser_windows(self, max_age: float = 2.0) -> list[gw.Window]:
+		"""Return top-level browser windows, reusing a scan younger than `max_age` seconds.
+
+		Cached windows that have since been closed (empty title) are dropped;
+		if none survive, a fresh enumeration is done.
+		"""
+		ts, cached = self._window_cache
+		if cached and time.monotonic() - ts < max_age:
+			alive = [w for w in cached if w.title]
+			if alive:
+				return alive
+
+		browser_windows = []
+		for win in gw.getAllWindows():
+			title = win.title
+			if title and _BROWSER_TITLE_RE.search(title):
+				browser_windows.append(win)
+		self._window_cache = (time.monotonic(), browser_windows)
+		return browser_windows
+
+	def _find_browser_window(self) -> Optional[gw.Window]:
+		"""Return the browser window used last, scanning for one only if it has gone away."""
+		hwnd = self._last_browser_hwnd
+		if hwnd and os.name == "nt":
+			user32 = ctypes.windll.user32
+			if user32.IsWindow(hwnd) and user32.IsWindowVisible(hwnd):
+				return gw.Window(hwnd)
+
+		browser_windows = self._browser_windows()
+		if not browser_windows:
+			self._last_browser_hwnd = None
+			return None
+		win = browser_windows[0]
+		self._last_browser_hwnd = getattr(win, "_hWnd", None)
+		return win
+
+	def _enum_browser_hwnds(self) -> list[tuple[int, str]]:
+		"""Return (hwnd, title) for visible top-level windows owned by a browser process."""
+		from ctypes import wintypes
+
+		user32 = ctypes.windll.user32
+		kernel32 = ctypes.windll.kernel32
+		psapi = ctypes.windll.psapi
+
+		EnumWindowsProc = ctypes.WINFUNCTYPE(ctypes.c_bool, wintypes.HWND, wintypes.LPARAM)
+		PROCESS_QUERY_INFORMATION = 0x0400
+		PROCESS_VM_READ = 0x0010
+		found: list[tuple[int, str]] = []
+
+		def enum_callback(hwnd, lParam):
+			if not user32.IsWindowVisible(hwnd):
+				return True
+			length = user32.GetWindowTextLengthW(hwnd)
+			if length <= 0:
+				return True
+
+			pid = wintypes.DWORD()
+			user32.GetWindowThreadProcessId(hwnd, ctypes.byref(pid))
+			hProcess = kernel32.OpenProcess(PROCESS_QUERY_INFORMATION | PROCESS_VM_READ, False, pid.value)
+			if not hProcess:
+				return True
+			try:
+				buffer = ctypes.create_unicode_buffer(260)
+				if psapi.GetModuleBaseNameW(hProcess, None, buffer, 260) <= 0:
+					return True
+				if buffer.value.lower() not in _BROWSER_PROCESSES:
+					return True
+			finally:
+				kernel32.CloseHandle(hProcess)
+
+			title = ctypes.create_unicode_buffer(length + 1)
+			user32.GetWindowTextW(hwnd, title, length + 1)
+			found.append((hwnd, title.value))
+			return True
 
-		pyautogui.FAILSAFE = False
+		user32.EnumWindows(EnumWindowsProc(enum_callback), 0)
+		return found
 
+	def _focus_tab_by_title(self, search_title: str) -> Optional[gw.Window]:
+		"""Find and focus a browser tab containing the track title."""
 		# Get first few words of title to match (more reliable)
 		# Split title and take first 3 words or first 20 chars
 		search_words = search_title.lower().split()[:3]
 		search_partial = " ".join(search_words) if search_words else search_title[:20].lower()
+		long_words = [word for word in search_words if len(word) > 3]
 
-		all_windows = gw.getAllWindows()
+		def _matches(title: str) -> bool:
+			title_lower = title.lower()
+			return search_partial in title_lower or any(word in title_lower for word in long_words)
 
-		# If not found directly, search through browser tabs
-		browser_windows = []
-		for win in all_windows:
-			if not win.title or not win.title.strip():
-				continue
-			title_lower = win.title.lower()
-			if any(b in title_lower for b in ["chrome", "edge", "firefox", "brave", "opera"]):
-				browser_windows.append(win)
+		# Fast path: if the track's tab is the active tab of a browser window,
+		# its title is the window title and no tab cycling is needed.
+		if os.name == "nt":
+			for hwnd, title in self._enum_browser_hwnds():
+				if _matches(title):
+					win = gw.Window(hwnd)
+					win.activate()
+					self._last_browser_hwnd = hwnd
+					return win
+
+		# Slow path: background tabs are only visible by cycling with Ctrl+Tab.
+		browser_windows = self._browser_windows()
 
 		for browser_win in browser_windows:
 			browser_win.activate()
-			time.sleep(0.3)
+			_delay(0.3)
 
 			original_title = browser_win.title
 			max_tabs = 15
 
 			for i in range(max_tabs):
 				current_win = gw.getActiveWindow()
-				if current_win and current_win.title:
-					title_lower = current_win.title.lower()
-					if search_partial in title_lower or any(word in title_lower for word in search_words if len(word) > 3):
-						return gw.getActiveWindow()
+				if current_win and current_win.title and _matches(current_win.title):
+					self._last_browser_hwnd = getattr(current_win, "_hWnd", None)
+					return current_win
 
 				pyautogui.hotkey("ctrl", "tab")
-				time.sleep(0.2)
+				_delay(0.2)
 
 				new_win = gw.getActiveWindow()
 				if new_win and new_win.title == original_title and i > 0:
@@ -353,16 +598,57 @@ class RandomPlayer:
 
 		return None
 
+	def _browser_titles(self) -> list[str]:
+		"""Return the current titles of all browser windows (no caching)."""
+		if os.name == "nt":
+			return [title for _, title in self._enum_browser_hwnds()]
+		return [w.title for w in gw.getAllWindows() if w.title and _BROWSER_TITLE_RE.search(w.title)]
+
+	async def _wait_for_tab_ready(self, title: str, timeout: float, settle: float = 0.0, poll: float = 0.1) -> bool:
+		"""Wait until a browser window title shows `title`, polling every `poll` seconds.
+
+		A page's title only changes once it has loaded, so this replaces a fixed
+		worst-case sleep. After a match, waits `settle` more seconds for the page
+		to take input. Gives up after `timeout` seconds and returns False.
+		"""
+		expected = title[:30].lower()
+		deadline = time.monotonic() + timeout * AUTOMATION_DELAY_SCALE
+		while time.monotonic() < deadline:
+			# The window scan is synchronous, so keep it off the loop thread
+			titles = await asyncio.to_thread(self._browser_titles)
+			if expected and any(expected in t.lower() for t in titles):
+				await _adelay(settle)
+				return True
+			await asyncio.sleep(poll)
+		return False
+
+	def _open_in_browser(self, url: str):
+		"""Open `url` in a new tab, through DevTools when configured so the tab can later be closed by id."""
+		tab_id = self._devtools.open_tab(url) if self._devtools else None
+		if tab_id is None:
+			webbrowser.open(url)
+		self._current_tab_id = tab_id
+
 	def _close_browser_tab(self, search_title: str) -> bool:
-		"""Find and close a browser tab containing the track title."""
-		pyautogui.FAILSAFE = False
+		"""Find and close a browser tab containing the track title.
+
+		A tab opened through DevTools is closed by id instead, without searching.
+		"""
+		tab_id = self._current_tab_id
+		if tab_id and self._devtools:
+			self._current_tab_id = None
+			if self._devtools.close_tab(tab_id):
+				self._window_cache = (0.0, [])
+				return True
 
 		focused = self._focus_tab_by_title(search_title)
 		if not focused:
 			return False
 
 		pyautogui.hotkey("ctrl", "w")
-		time.sleep(0.2)
+		_delay(0.2)
+		# Closing the last tab closes its window; drop the cached scan so it is not reused
+		self._window_cache = (0.0, [])
 		return True
 
 	def _navigate_in_same_tab(self, search_title: str, new_url: str) -> bool:
@@ -370,8 +656,6 @@ class RandomPlayer:
 		focus the address bar, type `new_url` and press Enter. Returns True
 		if navigation was attempted on an existing tab, False otherwise.
 		"""
-		pyautogui.FAILSAFE = False
-
 		# Try to focus the tab via helper
 		focused = self._focus_tab_by_title(search_title)
 
@@ -382,19 +666,19 @@ class RandomPlayer:
 		if focused is not None:
 			if self.is_window_fullscreen(focused):
 				pyautogui.press("f11")
-				time.sleep(0.2)
+				_delay(0.2)
 				pyautogui.press("f")
-				time.sleep(0.2)
+				_delay(0.2)
 				pyautogui.press("f")
-				time.sleep(0.2)
+				_delay(0.2)
 
-		time.sleep(0.2)
+		_delay(0.2)
 		pyautogui.hotkey("ctrl", "l")
 		pyautogui.hotkey("alt", "d")
-		time.sleep(0.1)
+		_delay(0.1)
 		pyautogui.typewrite(new_url, interval=0.01)
 		pyautogui.press("enter")
-		time.sleep(0.5)
+		_delay(0.5)
 		pyautogui.press("f11")
 
 		return True
@@ -453,7 +737,7 @@ class RandomPlayer:
 
 		if spotify_hwnd:
 			ShowWindow(spotify_hwnd, SW_SHOW)
-			time.sleep(0.1)
+			_delay(0.1)
 			SetForegroundWindow(spotify_hwnd)
 
 	def is_window_fullscreen(self, win, tol: int = 2) -> bool:
@@ -509,117 +793,135 @@ class RandomPlayer:
 		except Exception:
 			return False
 
-	def perform_vr_reset(self):
-		"""Bring a browser window to the foreground and click a predefined sequence of points that resets Voice Removal."""
-		pyautogui.FAILSAFE = False
+	def _screen_pixel(self, x: int, y: int) -> Optional[tuple[int, int, int]]:
+		"""Return the RGB color at screen (x, y) using GDI GetPixel.
+
+		Unlike pyautogui.pixel this reads a single pixel instead of capturing
+		the whole screen; off Windows a 1x1 Pillow grab is used. Returns None
+		if the pixel cannot be read.
+		"""
+		if os.name != "nt":
+			from PIL import ImageGrab
 
+			try:
+				pix = ImageGrab.grab(bbox=(x, y, x + 1, y + 1)).convert("RGB").getpixel((0, 0))
+			except OSError:
+				return None
+			return tuple(pix)
+		user32 = ctypes.windll.user32
+		gdi32 = ctypes.windll.gdi32
+		if self._screen_dc is None:
+			user32.GetDC.restype = ctypes.c_void_p
+			gdi32.GetPixel.argtypes = (ctypes.c_void_p, ctypes.c_int, ctypes.c_int)
+			gdi32.GetPixel.restype = ctypes.c_uint32
+			self._screen_dc = user32.GetDC(None)
+		color = gdi32.GetPixel(self._screen_dc, x, y)
+		if color == CLR_INVALID:
+			return None
+		return (color & 0xFF, (color >> 8) & 0xFF, (color >> 16) & 0xFF)
+
+	def _click(self, x: int, y: int):
+		"""Left-click at screen (x, y) with one SendInput call (no pyautogui pause)."""
+		if os.name != "nt":
+			pyautogui.click(x, y)
+			return
+		user32 = ctypes.windll.user32
+		user32.SetCursorPos(int(x), int(y))
+		inputs = (_INPUT * 2)(
+			_INPUT(INPUT_MOUSE, _MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTDOWN, 0, None)),
+			_INPUT(INPUT_MOUSE, _MOUSEINPUT(0, 0, 0, MOUSEEVENTF_LEFTUP, 0, None)),
+		)
+		user32.SendInput(2, inputs, ctypes.sizeof(_INPUT))
+
+	def _prepare_vr_browser(self) -> tuple[Optional[gw.Window], bool, bool]:
+		"""Common VR preamble: focus the browser and leave fullscreen so the extension icon is reachable.
+
+		Returns (target_win, is_youtube, is_spotify).
+		"""
 		# Try to find a browser window by common browser names
-		browser_keywords = ["chrome", "firefox", "edge", "brave", "opera"]
-		all_windows = gw.getAllWindows()
-		target_win = None
-		for w in all_windows:
-			if w.title and any(b in w.title.lower() for b in browser_keywords):
-				target_win = w
-				break
+		target_win = self._find_browser_window()
 
 		# Fallback: pick the first top-level window
-		if not target_win and all_windows:
-			target_win = all_windows[0]
+		if not target_win:
+			all_windows = gw.getAllWindows()
+			target_win = all_windows[0] if all_windows else None
 
 		if target_win:
 			target_win.activate()
-			time.sleep(0.3)
+			_delay(0.3)
 
-		# Detect platform playing state and toggle fullscreen for YouTube
-		is_youtube = self.current_platform == "youtube"
-		is_spotify = self.current_platform == "spotify"
+		platform = self.current_platform
+		is_youtube = platform == "youtube"
+		is_spotify = platform == "spotify"
 
 		# Deactivate fullscreen if needed
 		if self.is_window_fullscreen(target_win):
 			pyautogui.press("f11")
-			time.sleep(0.2)
+			_delay(0.2)
 			pyautogui.press("f")
-			time.sleep(0.2)
+			_delay(0.2)
 			pyautogui.press("f")
-			time.sleep(0.2)
+			_delay(0.2)
 
-		# Build the points list using calibration if available.
+		return target_win, is_youtube, is_spotify
+
+	def _vr_base_and_last(self, is_youtube: bool):
+		"""Return the calibrated base points and the platform-specific last point."""
 		base = self._vr_points.get("base", [(1694, 69), (1640, 127)])
 		if is_youtube:
 			last = self._vr_points.get("youtube_last", (1640, 640))
 		else:
 			last = self._vr_points.get("spotify_last", (1640, 590))
+		return base, last
+
+	async def perform_vr_reset_async(self):
+		"""Bring a browser window to the foreground and click a predefined sequence of points that resets Voice Removal."""
+		_, is_youtube, is_spotify = await asyncio.to_thread(self._prepare_vr_browser)
 
+		# Build the points list using calibration if available.
+		base, last = self._vr_base_and_last(is_youtube)
 		points = list(base) + [last]
-		print(f"   [DEBUG] Performing VR reset (YouTube: {is_youtube}, Spotify: {is_spotify}), points={points}")
+		log.debug("Performing VR reset (YouTube: %s, Spotify: %s), points=%s", is_youtube, is_spotify, points)
 		for x, y in points:
-			if pyautogui.pixel(x, y) == (76, 255, 0):
-				time.sleep(0.1)
-				pyautogui.click(x, y)
-				print("   [DEBUG] Detected green, turning it off and on")
-			time.sleep(0.3)
-			pyautogui.click(x, y)
-			time.sleep(0.1)
-			time.sleep(0.25)
+			if self._screen_pixel(x, y) == (76, 255, 0):
+				await _adelay(0.1)
+				self._click(x, y)
+				log.debug("Detected green, turning it off and on")
+			await _adelay(0.3)
+			self._click(x, y)
+			await _adelay(0.1)
+			await _adelay(0.25)
 
 		if is_youtube:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			y_extra = self._vr_points.get("youtube_extra", (1643, 20))
-			pyautogui.click(y_extra[0], y_extra[1])
+			self._click(y_extra[0], y_extra[1])
+			await _adelay(0.1)
 			# Press F11 once more before restoring via 'f'
 			pyautogui.press("f11")
-			time.sleep(0.2)
+			await _adelay(0.2)
 			# pyautogui.press('f')
 
 		# If Spotify was playing, press F11 again and bring the desktop Spotify app back to front
 		if is_spotify:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			pyautogui.press("f11")
-			time.sleep(0.1)
-			self._focus_spotify_app()
+			await _adelay(0.1)
+			await asyncio.to_thread(self._focus_spotify_app)
 
-	def perform_vr_on(self):
+	def perform_vr_reset(self):
+		"""Blocking wrapper around `perform_vr_reset_async`."""
+		return self._run_automation(self.perform_vr_reset_async())
+
+	async def perform_vr_on_async(self):
 		"""Perform VR ON sequence: click first point always; for remaining
 		points click only if the pixel at that coordinate is NOT green.
 		Returns set of playing pids like perform_vr_reset.
 		"""
-
-		pyautogui.FAILSAFE = False
-
-		# Find a browser window to activate
-		browser_keywords = ["chrome", "firefox", "edge", "brave", "opera"]
-		all_windows = gw.getAllWindows()
-		target_win = None
-		for w in all_windows:
-			if w.title and any(b in w.title.lower() for b in browser_keywords):
-				target_win = w
-				break
-
-		if not target_win and all_windows:
-			target_win = all_windows[0]
-
-		if target_win:
-			target_win.activate()
-			time.sleep(0.3)
-
-		is_youtube = self.current_platform == "youtube"
-		is_spotify = self.current_platform == "spotify"
+		_, is_youtube, is_spotify = await asyncio.to_thread(self._prepare_vr_browser)
 
 		# Determine last point based on platform and calibration
-		base = self._vr_points.get("base", [(1694, 69), (1640, 127)])
-		if is_youtube:
-			last = self._vr_points.get("youtube_last", (1640, 640))
-		else:
-			last = self._vr_points.get("spotify_last", (1640, 590))
-
-		# Deactivate fullscreen if needed
-		if self.is_window_fullscreen(target_win):
-			pyautogui.press("f11")
-			time.sleep(0.2)
-			pyautogui.press("f")
-			time.sleep(0.2)
-			pyautogui.press("f")
-			time.sleep(0.2)
+		base, last = self._vr_base_and_last(is_youtube)
 
 		# Points to click (first is always clicked)
 		points = list(base) + [last]
@@ -627,100 +929,78 @@ class RandomPlayer:
 		for idx, (x, y) in enumerate(points):
 			if idx == 0:
 				# Always click first point
-				pyautogui.click(x, y)
+				self._click(x, y)
 			else:
-				pix = pyautogui.pixel(x, y)
+				pix = self._screen_pixel(x, y)
 				# If pixel is green (76,255,0) skip click
 				if pix is None or tuple(pix) != (76, 255, 0):
-					pyautogui.click(x, y)
-			time.sleep(0.25)
-			time.sleep(0.25)
+					self._click(x, y)
+			await _adelay(0.25)
+			await _adelay(0.25)
 
 		if is_youtube:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			y_extra = self._vr_points.get("youtube_extra", (1643, 20))
-			pyautogui.click(y_extra[0], y_extra[1])
+			self._click(y_extra[0], y_extra[1])
+			await _adelay(0.1)
 			# Press F11 then restore via 'f'
 			pyautogui.press("f11")
-			time.sleep(0.2)
+			await _adelay(0.2)
 			pyautogui.press("f")
 
 		if is_spotify:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			pyautogui.press("f11")
-			time.sleep(0.1)
-			self._focus_spotify_app()
+			await _adelay(0.1)
+			await asyncio.to_thread(self._focus_spotify_app)
 
-	def perform_vr_off(self):
+	def perform_vr_on(self):
+		"""Blocking wrapper around `perform_vr_on_async`."""
+		return self._run_automation(self.perform_vr_on_async())
+
+	async def perform_vr_off_async(self):
 		"""Perform VR OFF sequence: click the first point always; check the
 		last point and click it only if it is GREEN (indicates ON), then
 		perform the same pre/post F/F11 handling as the other VR routines.
 		Returns set of playing pids like perform_vr_on.
 		"""
-		pyautogui.FAILSAFE = False
-
-		# Find a browser window to activate
-		browser_keywords = ["chrome", "firefox", "edge", "brave", "opera"]
-		all_windows = gw.getAllWindows()
-		target_win = None
-		for w in all_windows:
-			if w.title and any(b in w.title.lower() for b in browser_keywords):
-				target_win = w
-				break
-
-		if not target_win and all_windows:
-			target_win = all_windows[0]
-
-		if target_win:
-			target_win.activate()
-			time.sleep(0.3)
-
-		is_youtube = self.current_platform == "youtube"
-		is_spotify = self.current_platform == "spotify"
+		_, is_youtube, is_spotify = await asyncio.to_thread(self._prepare_vr_browser)
 
 		# Determine last point based on platform and calibration
-		base = self._vr_points.get("base", [(1694, 69), (1640, 127)])
-		if is_youtube:
-			last = self._vr_points.get("youtube_last", (1640, 640))
-		else:
-			last = self._vr_points.get("spotify_last", (1640, 590))
-
-		# Deactivate fullscreen if needed
-		if self.is_window_fullscreen(target_win):
-			pyautogui.press("f11")
-			time.sleep(0.2)
-			pyautogui.press("f")
-			time.sleep(0.2)
-			pyautogui.press("f")
-			time.sleep(0.2)
+		base, last = self._vr_base_and_last(is_youtube)
 
 		first = tuple(base[0]) if base and len(base) > 0 else (1694, 69)
 		# last is already set above
 
 		# Always click first point
-		pyautogui.click(first[0], first[1])
-		time.sleep(0.3)
+		self._click(first[0], first[1])
+		await _adelay(0.3)
 
 		# Check last pixel; click it only if it's green (76,255,0)
-		pix = pyautogui.pixel(last[0], last[1])
+		pix = self._screen_pixel(last[0], last[1])
 		if pix is not None and tuple(pix) == (76, 255, 0):
-			pyautogui.click(last[0], last[1])
-			time.sleep(0.3)
+			self._click(last[0], last[1])
+			await _adelay(0.3)
 
 		# Post-click state: mirror other routines
 		if is_youtube:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			y_extra = self._vr_points.get("youtube_extra", (1643, 20))
-			pyautogui.click(y_extra[0], y_extra[1])
+			self._click(y_extra[0], y_extra[1])
+			await _adelay(0.1)
 			pyautogui.press("f11")
-			time.sleep(0.2)
+			await _adelay(0.2)
 			pyautogui.press("f")
 
 		if is_spotify:
-			time.sleep(0.2)
+			await _adelay(0.2)
 			pyautogui.press("f11")
-			time.sleep(0.1)
-			self._focus_spotify_app()
+			await _adelay(0.1)
+			await asyncio.to_thread(self._focus_spotify_app)
+
+	def perform_vr_off(self):
+		"""Blocking wrapper around `perform_vr_off_async`."""
+		return self._run_automation(self.perform_vr_off_async())
 
 	def _track_key(self, track: Track) -> str:
 		"""Return a stable key identifying a track for counting plays."""
@@ -730,22 +1010,48 @@ class RandomPlayer:
 			return track.url
 		return f"{track.platform}:{track.title} - {track.artist}"
 
-	def _fill_queue(self, platform: Optional[str] = None):
-		"""Fill the queue with upcoming random tracks, prioritizing least played."""
+	def _record_play(self, track: Track):
+		"""Append `track` to the play history and increment its play count."""
+		key = self._track_key(track)
+		self.played_tracks.append(track)
+		self.play_counts[key] = self.play_counts.get(key, 0) + 1
+		log.debug("Play count for '%s': %d", key, self.play_counts[key])
+		# persisted by the background flush
+		self._play_counts_dirty = True
+
+	def _fill_queue(self, platform: Optional[str] = None, k: Optional[int] = None):
+		"""Fill the queue with upcoming random tracks, prioritizing least played.
+
+		If `k` is given, only a random batch of at most `k` candidates is queued.
+		"""
+		# Track lists are immutable snapshots, so they can be read without the lock
+		tracks = self.all_tracks if platform is None else (self.youtube_tracks if platform == "youtube" else self.spotify_tracks)
+		if not tracks:
+			return
+		# Get candidates: tracks with lowest play count (one key/count lookup per track)
+		track_key = self._track_key
+		play_counts = self.play_counts
+		counts = [play_counts.get(track_key(t), 0) for t in tracks]
+		min_count = min(counts, default=0)
+		# Never empty: at least one track has the minimum count
+		candidates = [t for t, c in zip(tracks, counts) if c == min_count]
+		# Draw a random order (or just a batch) and add to queue
+		n = len(candidates) if k is None else min(k, len(candidates))
+		picked = random.sample(candidates, k=n)
 		with self._playlist_lock:
-			tracks = self.all_tracks if platform is None else (self.youtube_tracks if platform == "youtube" else self.spotify_tracks)
-			if not tracks:
-				return
-			# Get candidates: tracks with lowest play count
-			counts = [self.play_counts.get(self._track_key(t), 0) for t in tracks]
-			min_count = min(counts) if counts else 0
-			candidates = [t for t, c in zip(tracks, counts) if c == min_count]
-			if not candidates:
-				candidates = tracks
-			# Shuffle and add to queue
-			random.shuffle(candidates)
-			self._queue.extend(candidates)
-			print(f"   [DEBUG] Filled queue with {len(self._queue)} tracks ({platform or 'all'})")
+			self._queue.extend(picked)
+			queued = len(self._queue)
+		log.debug("Filled queue with %d tracks (%s)", queued, platform or "all")
+
+	def shuffle_queue(self) -> list[Track]:
+		"""Shuffle the queue in place and return a snapshot of the new order."""
+		with self._playlist_lock:
+			# Shuffling a deque directly costs O(n) per index; shuffle a list copy instead
+			items = list(self._queue)
+			random.shuffle(items)
+			self._queue.clear()
+			self._queue.extend(items)
+		return items
 
 	def stop_current(self, wait_after: bool = True):
 		"""Stop the currently playing track - closes the tab by searching for the track title."""
@@ -774,55 +1080,65 @@ class RandomPlayer:
 		self.current_platform = None
 
 		if closed and wait_after:
-			time.sleep(0.3)
+			_delay(0.3)
+
+	def _spotify_active(self) -> bool:
+		"""Return True if the current track is a Spotify one."""
+		return self._spotify_playing or self.current_platform == "spotify"
+
+	def _pause_autoplay(self) -> bool:
+		"""Cancel a running autoplay timer and remember its remaining time. Returns False if none was running."""
+		timer = self._autoplay_timer
+		if not timer or self._autoplay_paused:
+			return False
+		timer.cancel()
+		self._autoplay_timer = None
+		start, duration = self._autoplay_start_time, self._autoplay_duration
+		if start is not None and duration:
+			self._autoplay_remaining = max(0.1, duration - (time.perf_counter() - start))
+		else:
+			self._autoplay_remaining = None
+		self._autoplay_paused = True
+		return True
+
+	def _resume_autoplay(self) -> bool:
+		"""Restart a paused autoplay timer with its remaining time. Returns False if nothing was paused."""
+		remaining = self._autoplay_remaining
+		if not self._autoplay_paused or remaining is None:
+			return False
+		self._start_autoplay_timer(remaining)
+		return True
 
 	def pause_playback(self) -> bool:
 		"""Pause/unpause playback by focusing the relevant browser tab or app and pressing Space.
 
 		Returns True if the keypress was attempted, False otherwise.
 		"""
-		pyautogui.FAILSAFE = False
-
 		# Try to focus the browser tab for the current track title
 		if self._current_track_title:
 			self._focus_tab_by_title(self._current_track_title)
 
-		# Manage autoplay timer bookkeeping: if a timer is active, pause it
-		if self._autoplay_timer and not self._autoplay_paused:
-			# compute elapsed and remaining
-			if self._autoplay_start_time and self._autoplay_duration:
-				elapsed = time.time() - self._autoplay_start_time
-				remaining = self._autoplay_duration - elapsed
-			else:
-				remaining = None
-			self._autoplay_timer.cancel()
-			self._autoplay_timer = None
-			self._autoplay_remaining = None if remaining is None else max(0.1, float(remaining))
-			self._autoplay_paused = True
-		elif self._autoplay_paused and (self._autoplay_remaining is not None):
-			# resume with remaining time
-			self._start_autoplay_timer(self._autoplay_remaining)
-			self._autoplay_remaining = None
-			self._autoplay_paused = False
+		# Pause the autoplay timer along with the track, or resume it
+		if not self._pause_autoplay():
+			self._resume_autoplay()
 
 		pyautogui.press("space")
 		# If playing spotify, focus the app
-		if self._spotify_playing or (self.current_platform == "spotify"):
+		if self._spotify_active():
 			self._focus_spotify_app()
 		return True
 
-	def refresh_current_tab(self) -> bool:
+	async def refresh_current_tab_async(self) -> bool:
 		"""Find the currently playing browser tab (by title) and refresh it.
 
 		Returns True if a refresh keypress was attempted, False otherwise.
 		"""
-		pyautogui.FAILSAFE = False
 		title = self._current_track_title
 		if not title:
 			return False
 
 		# Try to focus the tab for the current track
-		focused = self._focus_tab_by_title(title)
+		focused = await asyncio.to_thread(self._focus_tab_by_title, title)
 
 		if not focused:
 			return False
@@ -845,21 +1161,29 @@ class RandomPlayer:
 			self._start_autoplay_timer(timer_dur)
 
 		# give a short moment for the refresh to apply
-		time.sleep(0.15)
+		await _adelay(0.15)
 
 		# Press F if youTube to restore fullscreen
 		if self.current_platform == "youtube":
-			time.sleep(2)
+			await _adelay(2)
 			pyautogui.press("f")
 
 		return True
 
-	def _on_track_end(self):
-		"""Callback when a track finishes playing."""
+	def refresh_current_tab(self) -> bool:
+		"""Blocking wrapper around `refresh_current_tab_async`."""
+		return self._run_automation(self.refresh_current_tab_async())
+
+	def _on_track_end(self, from_timer: bool = False):
+		"""Callback when a track finishes playing.
+
+		`from_timer` is set when called from the autoplay task itself, whose
+		timer must be forgotten rather than cancelled.
+		"""
 		print("\n⏭️  Track finished — auto-playing next track")
 		try:
-			# clear autoplay bookkeeping (timer already fired)
-			if self._autoplay_timer:
+			# clear autoplay bookkeeping; cancelling would cancel the task running this call
+			if self._autoplay_timer and not from_timer:
 				self._autoplay_timer.cancel()
 			self._autoplay_timer = None
 			self._autoplay_start_time = None
@@ -873,7 +1197,13 @@ class RandomPlayer:
 			self._play_next_from_queue()
 
 		except Exception as e:
-			print(f"   [DEBUG] Error in _on_track_end: {e}")
+			log.warning("Error in _on_track_end: %s", e)
+
+	async def _autoplay_after(self, duration: float):
+		"""Wait `duration` seconds on the player loop, then advance to the next track."""
+		await asyncio.sleep(duration)
+		# _on_track_end waits on automation coroutines, so it must run off the loop thread
+		await asyncio.to_thread(self._on_track_end, from_timer=True)
 
 	def _start_autoplay_timer(self, duration: float):
 		"""Start a timer to auto-play next track after duration seconds."""
@@ -884,16 +1214,15 @@ class RandomPlayer:
 			if self._autoplay_timer:
 				self._autoplay_timer.cancel()
 			# reset bookkeeping for a new timer
-			self._autoplay_start_time = time.time()
+			self._autoplay_start_time = time.perf_counter()
 			self._autoplay_duration = float(duration)
 			self._autoplay_remaining = None
 			self._autoplay_paused = False
-			self._autoplay_timer = threading.Timer(duration, self._on_track_end)
-			self._autoplay_timer.daemon = True
-			self._autoplay_timer.start()
-			print(f"   [DEBUG] Autoplay timer started for {duration} seconds")
+			# One long-lived loop thread serves every timer instead of a thread per track
+			self._autoplay_timer = self.submit_coro(self._autoplay_after(float(duration)))
+			log.debug("Autoplay timer started for %s seconds", duration)
 		except Exception as e:
-			print(f"   [DEBUG] Failed to start autoplay timer: {e}")
+			log.warning("Failed to start autoplay timer: %s", e)
 
 	def start_menu_window(self):
 		"""Start the Next Up (Menu) GUI window in background."""
@@ -920,9 +1249,9 @@ class RandomPlayer:
 	def _play_next_from_queue(self):
 		"""Play the next track from the queue, refilling if necessary."""
 		if not self._queue:
-			self._fill_queue()
+			self._fill_queue(k=self._queue_refill_batch)
 		if self._queue:
-			track = self._queue.pop(0)
+			track = self._queue.popleft()
 			self.play_track(track)
 		else:
 			print("No tracks in queue!")
@@ -934,8 +1263,12 @@ class RandomPlayer:
 		spotify_client_id: str,
 		spotify_client_secret: str,
 		silent: bool = False,
-	):
-		"""Load both playlists."""
+	) -> bool:
+		"""Load both playlists.
+
+		Returns False when a silent refresh found the same tracks as last time
+		and skipped the update, True otherwise.
+		"""
 		# Store URLs for refresh
 		self._youtube_url = youtube_url
 		self._spotify_url = spotify_url
@@ -947,48 +1280,92 @@ class RandomPlayer:
 
 		new_youtube_tracks: list[Track] = []
 		new_spotify_tracks: list[Track] = []
-		tracks = self.all_tracks
-		counts = [self.play_counts.get(self._track_key(t), 0) for t in tracks]
-		min_count = min(counts) if counts else 0
+		track_key = self._track_key
+		play_counts = self.play_counts
+		min_count = min((play_counts.get(track_key(t), 0) for t in self.all_tracks), default=0)
 
 		# Load YouTube playlist
 		if youtube_url:
-			yt_playlist = YouTubePlaylist(youtube_url)
-			new_youtube_tracks = yt_playlist.fetch_videos() if not silent else self._fetch_youtube_silent(youtube_url)
-			new_youtube_tracks = [t for t in new_youtube_tracks if self.play_counts.get(self._track_key(t), 0) == min_count]
+			if silent:
+				new_youtube_tracks = self._fetch_youtube_silent(youtube_url)
+			else:
+				new_youtube_tracks = YouTubePlaylist(
+					youtube_url,
+					resolve_missing_durations=self._resolve_youtube_durations,
+					cache=self._track_cache,
+				).fetch_videos()
+			new_youtube_tracks = [t for t in new_youtube_tracks if play_counts.get(track_key(t), 0) == min_count]
 
 		# Load Spotify playlist
 		if spotify_url and spotify_client_id and spotify_client_secret:
-			sp_playlist = SpotifyPlaylist(spotify_url, spotify_client_id, spotify_client_secret)
+			sp_playlist = SpotifyPlaylist.from_session(
+				spotify_url,
+				self._get_spotify_catalog_api(spotify_client_id, spotify_client_secret),
+				cache=self._track_cache,
+			)
 			new_spotify_tracks = (
 				sp_playlist.fetch_tracks()
 				if not silent
 				else self._fetch_spotify_silent(spotify_url, spotify_client_id, spotify_client_secret)
 			)
-			new_spotify_tracks = [t for t in new_spotify_tracks if self.play_counts.get(self._track_key(t), 0) == min_count]
+			new_spotify_tracks = [t for t in new_spotify_tracks if play_counts.get(track_key(t), 0) == min_count]
 
-		# Update tracks with lock
+		# Nothing to diff if a background refresh fetched exactly the same tracks; durations are
+		# part of the signature so a refresh that resolves a missing one is not discarded
+		sig = (
+			frozenset((t.url, t.duration) for t in new_youtube_tracks),
+			frozenset((t.url, t.duration) for t in new_spotify_tracks),
+		)
+		if silent and sig == self._last_fetch_sig:
+			return False
+		self._last_fetch_sig = sig
+
+		# Publish fresh track lists by rebinding; readers see either the old or the new snapshot
+		old_count = len(self.all_tracks)
+		old_urls = self._all_urls
+		new_all_tracks = new_youtube_tracks + new_spotify_tracks
+		by_url = {a.url: a for a in new_all_tracks}
+		all_urls = set(by_url)
+		self.youtube_tracks = new_youtube_tracks
+		self.spotify_tracks = new_spotify_tracks
+		self.all_tracks = new_all_tracks
+		self._all_urls = all_urls
+		new_count = len(new_all_tracks)
+
+		# Tracks new to the playlists depend only on the snapshots, so find them
+		# before taking the lock
+		new_tracks = [t for t in new_all_tracks if t.url not in old_urls]
+
+		# Queue edits still go through the lock (the GUI reorders it concurrently);
+		# only the O(queue) pass and the final filter run while it is held
 		with self._playlist_lock:
-			old_all_tracks = self.all_tracks.copy()
-			old_count = len(self.all_tracks)
-			self.youtube_tracks = new_youtube_tracks
-			self.spotify_tracks = new_spotify_tracks
-			self.all_tracks = self.youtube_tracks + self.spotify_tracks
-			new_count = len(self.all_tracks)
-
-			# Remove tracks no longer in playlists
-			removed_tracks = [t for t in self._queue if t.url not in [a.url for a in self.all_tracks]]
-			if removed_tracks:
-				self._queue = [t for t in self._queue if t.url in [a.url for a in self.all_tracks]]
-
-			# Find new tracks
-			new_tracks = [t for t in self.all_tracks if t.url not in [o.url for o in old_all_tracks]]
-			if new_tracks:
-				# Add new tracks to the queue, avoiding duplicates
-				new_unique = [t for t in new_tracks if t.url not in [q.url for q in self._queue]]
-				self._queue.extend(new_unique)
-			else:
-				new_unique = []
+			# One pass over the queue: drop tracks no longer in playlists, carry over a
+			# newly resolved duration (the silent fetchers don't return adder metadata,
+			# so the queued Track is kept otherwise) and collect the URLs that stay
+			kept: deque[Track] = deque()
+			removed_tracks: list[Track] = []
+			updated = False
+			queue_urls: set[str] = set()
+			for t in self._queue:
+				fresh = by_url.get(t.url)
+				if fresh is None:
+					removed_tracks.append(t)
+					continue
+				if fresh.duration != t.duration:
+					t = replace(t, duration=fresh.duration)
+					updated = True
+				kept.append(t)
+				queue_urls.add(t.url)
+			if removed_tracks or updated:
+				self._queue = kept
+
+			# New tracks not already queued
+			new_unique: list[Track] = []
+			for t in new_tracks:
+				if t.url not in queue_urls:
+					new_unique.append(t)
+					queue_urls.add(t.url)
+			self._queue.extend(new_unique)
 
 		if not silent:
 			print(f"\n📊 Total tracks available: {len(self.all_tracks)}")
@@ -1005,60 +1382,48 @@ class RandomPlayer:
 			if removed_tracks:
 				print(f"   - Removed {len(removed_tracks)} tracks from queue")
 
-		if new_unique or removed_tracks:
+		if new_unique or removed_tracks or updated:
 			self.update_menu_file()
+		return True
 
 	def _fetch_youtube_silent(self, url: str) -> list[Track]:
-		"""Fetch YouTube playlist silently."""
-		import yt_dlp
-
-		ydl_opts = {
-			"quiet": True,
-			"no_warnings": True,
-			"extract_flat": True,
-			"skip_download": True,
-		}
-		videos: list[Track] = []
-		with yt_dlp.YoutubeDL(ydl_opts) as ydl:
-			result = ydl.extract_info(url, download=False)
-			if result and "entries" in result:
-				for entry in result["entries"]:
-					if entry:
-						vid = entry.get("id", "")
-						duration = entry.get("duration")
-						if duration is None and vid:
-							info = ydl.extract_info(f"https://www.youtube.com/watch?v={vid}", download=False)
-							duration = info.get("duration") if info else None
-						videos.append(
-							Track(
-								title=entry.get("title", "Unknown"),
-								artist=entry.get("uploader", "Unknown"),
-								platform="youtube",
-								url=f"https://www.youtube.com/watch?v={vid}",
-								duration=float(duration) if duration else None,
-							)
-						)
-		return videos
+		"""Fetch YouTube playlist silently, keeping the current tracks if the fetch fails."""
+		playlist = YouTubePlaylist(url, resolve_missing_durations=self._resolve_youtube_durations, cache=self._track_cache)
+		try:
+			return playlist.fetch_videos(silent=True)
+		except Exception as e:
+			log.warning("YouTube refresh failed: %s", e)
+			return self.youtube_tracks
+
+	def _get_spotify_catalog_api(self, client_id: str, client_secret: str):
+		"""Return the shared client-credentials Spotify client, rebuilding it if credentials change."""
+		creds = (client_id, client_secret)
+		if self._spotify_catalog_api is None or self._spotify_catalog_creds != creds:
+			self._spotify_catalog_api = build_spotify_client(client_id, client_secret)
+			self._spotify_catalog_creds = creds
+		return self._spotify_catalog_api
 
 	def _fetch_spotify_silent(self, url: str, client_id: str, client_secret: str) -> list[Track]:
 		"""Fetch Spotify playlist silently."""
 		try:
-			import re
-
-			import spotipy
-			from spotipy.oauth2 import SpotifyClientCredentials
-
-			match = re.search(r"playlist/([a-zA-Z0-9]+)", url)
+			match = _SPOTIFY_PLAYLIST_RE.search(url)
 			if not match:
 				return self.spotify_tracks
 			playlist_id = match.group(1)
 
-			auth_manager = SpotifyClientCredentials(client_id=client_id, client_secret=client_secret)
-			sp = spotipy.Spotify(auth_manager=auth_manager)
+			sp = self._get_spotify_catalog_api(client_id, client_secret)
 
 			tracks: list[Track] = []
-			results = sp.playlist_tracks(playlist_id)
-			while results:
+			offset = 0
+			while True:
+				results = call_with_backoff(
+					sp.playlist_items,
+					playlist_id,
+					fields=PLAYLIST_ITEMS_FIELDS,
+					limit=PLAYLIST_ITEMS_PAGE_SIZE,
+					offset=offset,
+					additional_types=("track",),
+				)
 				for item in results["items"]:
 					track = item.get("track")
 					if track:
@@ -1073,7 +1438,9 @@ class RandomPlayer:
 								duration=(track.get("duration_ms") / 1000.0) if track.get("duration_ms") else None,
 							)
 						)
-				results = sp.next(results) if results["next"] else None
+				if not results.get("next") or not results["items"]:
+					break
+				offset += len(results["items"])
 			return tracks
 		except Exception:
 			return self.spotify_tracks  # Keep existing on error
@@ -1081,14 +1448,20 @@ class RandomPlayer:
 	def _refresh_loop(self):
 		"""Background thread that refreshes playlists periodically."""
 		print("🔄 Refresh thread started")
-		while not self._stop_refresh.wait(self.refresh_interval):
-			self.load_playlists(
+		interval = self.refresh_interval
+		while not self._stop_refresh.wait(interval):
+			changed = self.load_playlists(
 				self._youtube_url,
 				self._spotify_url,
 				self._spotify_client_id,
 				self._spotify_client_secret,
 				silent=True,
 			)
+			# Poll less often while the playlists are stable; snap back on any change
+			if changed:
+				interval = self.refresh_interval
+			else:
+				interval = min(interval * 2, max(self.refresh_interval, self.refresh_max_interval))
 
 	def start_auto_refresh(self):
 		"""Start the background playlist refresh thread."""
@@ -1102,39 +1475,40 @@ class RandomPlayer:
 		self._stop_refresh.set()
 		if self._refresh_thread:
 			self._refresh_thread.join(timeout=1)
+		# The GUI quit path exits via os._exit, which skips atexit handlers
+		self._flush_play_counts()
 
-	def play_track(self, track: Track):
+	async def play_track_async(self, track: Track):
 		"""Play a track based on its platform."""
 		# For YouTube, try to reuse the existing browser tab instead of closing it.
 		# For Spotify, we handle closing inline to prevent title change issues.
-		if track.platform == "youtube":
-			reused = False
-			if self._current_track_title:
-				reused = self._navigate_in_same_tab(self._current_track_title, track.url)
+		platform = track.platform
+		reused = False
+		if platform == "youtube" and self._current_track_title:
+			reused = await asyncio.to_thread(self._navigate_in_same_tab, self._current_track_title, track.url)
 
 		print("\n▶️  Now Playing:")
-		print(f"   Platform: {track.platform.upper()}")
+		print(f"   Platform: {platform.upper()}")
 		print(f"   Title: {track.title}")
 		print(f"   Artist: {track.artist}")
 
-		if track.platform == "youtube":
+		if platform == "youtube":
 			# Store track title for later tab identification
 			self._current_track_title = track.title
 			# If we successfully reused an existing tab, flags are set by the helper
-			if not locals().get("reused", False):
+			if not reused:
 				# Open YouTube video in browser
-				webbrowser.open(track.url)
+				await asyncio.to_thread(self._open_in_browser, track.url)
 				self.current_platform = "youtube"
 				self._youtube_playing = True
 				print(f"   → Opened in browser: {track.url}")
 				# If this is the first played track overall, press F11 after opening
-				pyautogui.FAILSAFE = False
 				if len(self.played_tracks) == 0:
-					time.sleep(0.5)
+					await _adelay(0.5)
 					pyautogui.press("f11")
 
 				# Wait for video to load, then press 'f' for YouTube fullscreen toggle
-				time.sleep(5)
+				await self._wait_for_tab_ready(track.title, timeout=4.0, settle=1.0)
 				pyautogui.press("f")
 				print("   → Fullscreen activated")
 				# start autoplay timer if duration known
@@ -1146,18 +1520,17 @@ class RandomPlayer:
 				self._youtube_playing = True
 				print(f"   → Reused existing browser tab for: {track.url}")
 				# Wait for video to load, then press 'f' for YouTube fullscreen toggle
-				time.sleep(5)
+				await self._wait_for_tab_ready(track.title, timeout=4.0, settle=1.0)
 				pyautogui.press("f")
 				print("   → Fullscreen activated (reused tab)")
 				# start autoplay timer if duration known
 				if track.duration:
 					self._start_autoplay_timer(track.duration)
 
-		elif track.platform == "spotify":
+		elif platform == "spotify":
 			# Try to reuse the existing browser tab (YouTube or Spotify) before closing
-			reused = False
 			if self._current_track_title:
-				reused = self._navigate_in_same_tab(self._current_track_title, track.url)
+				reused = await asyncio.to_thread(self._navigate_in_same_tab, self._current_track_title, track.url)
 
 			if reused:
 				# Reused tab for Spotify URL
@@ -1166,8 +1539,8 @@ class RandomPlayer:
 				self._spotify_playing = True
 				print(f"   → Reused existing browser tab for: {track.url}")
 				# Give page some time to load and then focus desktop Spotify app if desired
-				time.sleep(3.5)
-				self._focus_spotify_app()
+				await self._wait_for_tab_ready(track.title, timeout=3.0, settle=0.5)
+				await asyncio.to_thread(self._focus_spotify_app)
 				# start autoplay timer if duration known — trigger 3s early for Spotify
 				if track.duration:
 					timer_dur = track.duration - 5 if track.duration > 5 else track.duration
@@ -1177,21 +1550,22 @@ class RandomPlayer:
 			else:
 				# Close previous YouTube tab if there was one
 				if self._youtube_playing and self._current_track_title:
-					print(f"   [DEBUG] Closing YouTube tab: '{self._current_track_title}'")
-					self._close_browser_tab(self._current_track_title)
+					log.debug("Closing YouTube tab: '%s'", self._current_track_title)
+					await asyncio.to_thread(self._close_browser_tab, self._current_track_title)
 					self._youtube_playing = False
 
 				# Close previous Spotify tab first (before it changes title)
 				if self._spotify_playing and self._current_track_title:
-					print(f"   [DEBUG] Closing Spotify tab: '{self._current_track_title}'")
-					result = self._close_browser_tab(self._current_track_title)
-					print(f"   [DEBUG] Close result: {result}")
+					log.debug("Closing Spotify tab: '%s'", self._current_track_title)
+					result = await asyncio.to_thread(self._close_browser_tab, self._current_track_title)
+					log.debug("Close result: %s", result)
 					self._spotify_playing = False
-					time.sleep(0.5)  # Wait for tab to close before opening new one
+					await _adelay(0.5)  # Wait for tab to close before opening new one
 				else:
-					print(
-						f"   [DEBUG] No Spotify tab to close. "
-						f"Playing={self._spotify_playing}, Title={self._current_track_title}"
+					log.debug(
+						"No Spotify tab to close. Playing=%s, Title=%s",
+						self._spotify_playing,
+						self._current_track_title,
 					)
 
 				# Now update title and open new tab
@@ -1199,20 +1573,19 @@ class RandomPlayer:
 
 				# Open Spotify in browser, then focus the desktop app
 				if track.url:
-					webbrowser.open(track.url)
+					await asyncio.to_thread(self._open_in_browser, track.url)
 					self.current_platform = "spotify"
 					self._spotify_playing = True
 					print(f"   → Opened in browser: {track.url}")
 					# If this is the first played track overall, press F11 after opening
-					pyautogui.FAILSAFE = False
 					if len(self.played_tracks) == 0:
-						time.sleep(0.5)
+						await _adelay(0.5)
 						pyautogui.press("f11")
 						print("   → F11 pressed (first track)")
 
 					# Focus the Spotify desktop app by finding its process
-					time.sleep(3)
-					self._focus_spotify_app()
+					await self._wait_for_tab_ready(track.title, timeout=2.5, settle=0.5)
+					await asyncio.to_thread(self._focus_spotify_app)
 					# start autoplay timer if duration known — trigger 3s early for Spotify
 					if track.duration:
 						timer_dur = track.duration - 4 if track.duration > 4 else track.duration
@@ -1221,14 +1594,11 @@ class RandomPlayer:
 							timer_dur = max(0.5, track.duration * 0.9)
 						self._start_autoplay_timer(timer_dur)
 
-		self.played_tracks.append(track)
+		self._record_play(track)
 
-		# increment play count
-		key = self._track_key(track)
-		self.play_counts[key] = self.play_counts.get(key, 0) + 1
-		print(f"   [DEBUG] Play count for '{key}': {self.play_counts[key]}")
-		# persist updated counts
-		self._save_play_counts()
+	def play_track(self, track: Track):
+		"""Blocking wrapper around `play_track_async`."""
+		return self._run_automation(self.play_track_async(track))
 
 	def play_random(self) -> Optional[Track]:
 		"""Play the next track from the queue (randomly filled)."""
@@ -1250,6 +1620,5 @@ class RandomPlayer:
 		if not self._queue:
 			return
 		if self._next_up_window:
-			with self._playlist_lock:
-				q_copy = list(self._queue)
-				self._next_up_window.schedule_update(q_copy)
+			# The window snapshots the queue itself once its debounce window fires
+			self._next_up_window.schedule_update()
@@ -1,16 +1,21 @@
 """Desktop-first player core: Spotify in desktop app, YouTube in browser."""
 
+import asyncio
+import contextlib
+import logging
 import os
 import threading
-import time
 
 import spotipy
 from spotipy.exceptions import SpotifyException
 from spotipy.oauth2 import SpotifyOAuth
 
 from backend.player_core import RandomPlayer as BrowserHybridPlayer
+from backend.player_core import _adelay, _delay
 from models import Track
 
+log = logging.getLogger(__name__)
+
 
 class RandomPlayer(BrowserHybridPlayer):
 	"""Player core that launches Spotify in desktop app and YouTube in browser."""
@@ -95,21 +100,17 @@ class RandomPlayer(BrowserHybridPlayer):
 		self._spotify_api = None
 		self._spotify_oauth_manager = None
 		self._spotify_auth_failed = False
-		try:
-			cache_path = self._spotify_auth_cache_path()
-			if os.path.exists(cache_path):
-				os.remove(cache_path)
-		except Exception:
-			pass
+		with contextlib.suppress(OSError):
+			os.remove(self._spotify_auth_cache_path())
 
 	def _mark_spotify_auth_failed(self, exc: Exception):
 		"""Mark Spotify auth as failed and avoid retry loops until explicit reset."""
 		self._spotify_api = None
 		self._spotify_oauth_manager = None
 		if not self._spotify_auth_failed:
-			print(f"   [DEBUG] Spotify auth/server error: {exc}")
-			print(f"   [DEBUG] Redirect URI: {self._spotify_redirect_uri()}")
-			print("   [DEBUG] Run reset_spotify_auth() after fixing config to retry.")
+			log.warning("Spotify auth/server error: %s", exc)
+			log.warning("Redirect URI: %s", self._spotify_redirect_uri())
+			log.warning("Run reset_spotify_auth() after fixing config to retry.")
 		self._spotify_auth_failed = True
 
 	def _get_spotify_api(self) -> spotipy.Spotify | None:
@@ -161,7 +162,7 @@ class RandomPlayer(BrowserHybridPlayer):
 				self._spotify_device_id = first["id"]
 				return self._spotify_device_id
 		except Exception as exc:
-			print(f"   [DEBUG] Failed to list Spotify devices: {exc}")
+			log.warning("Failed to list Spotify devices: %s", exc)
 
 		return None
 
@@ -175,7 +176,7 @@ class RandomPlayer(BrowserHybridPlayer):
 			sp.transfer_playback(device_id=device_id, force_play=False)
 		except SpotifyException as exc:
 			# Device might already be active or temporarily unavailable.
-			print(f"   [DEBUG] Spotify transfer playback warning: {exc}")
+			log.warning("Spotify transfer playback warning: %s", exc)
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
 		return device_id
@@ -198,7 +199,7 @@ class RandomPlayer(BrowserHybridPlayer):
 				sp.start_playback(uris=[uri])
 			return True
 		except SpotifyException as exc:
-			print(f"   [DEBUG] Spotify API start_playback failed: {exc}")
+			log.warning("Spotify API start_playback failed: %s", exc)
 			return False
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
@@ -218,7 +219,7 @@ class RandomPlayer(BrowserHybridPlayer):
 				sp.pause_playback()
 			return True
 		except SpotifyException as exc:
-			print(f"   [DEBUG] Spotify API pause failed: {exc}")
+			log.warning("Spotify API pause failed: %s", exc)
 			return False
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
@@ -245,7 +246,7 @@ class RandomPlayer(BrowserHybridPlayer):
 					sp.start_playback()
 			return True
 		except SpotifyException as exc:
-			print(f"   [DEBUG] Spotify API play/pause toggle failed: {exc}")
+			log.warning("Spotify API play/pause toggle failed: %s", exc)
 			return False
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
@@ -265,7 +266,7 @@ class RandomPlayer(BrowserHybridPlayer):
 				sp.next_track()
 			return True
 		except SpotifyException as exc:
-			print(f"   [DEBUG] Spotify API next_track failed: {exc}")
+			log.warning("Spotify API next_track failed: %s", exc)
 			return False
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
@@ -285,46 +286,47 @@ class RandomPlayer(BrowserHybridPlayer):
 				sp.previous_track()
 			return True
 		except SpotifyException as exc:
-			print(f"   [DEBUG] Spotify API previous_track failed: {exc}")
+			log.warning("Spotify API previous_track failed: %s", exc)
 			return False
 		except Exception as exc:
 			self._mark_spotify_auth_failed(exc)
 			return False
 
-	def play_track(self, track: Track):
+	async def play_track_async(self, track: Track):
 		"""Play YouTube in browser and Spotify via API (desktop app target)."""
-		if track.platform == "youtube" and (self._spotify_playing or self.current_platform == "spotify"):
-			paused = self._spotify_pause()
+		platform = track.platform
+		if platform == "youtube" and self._spotify_active():
+			paused = await asyncio.to_thread(self._spotify_pause)
 			if not paused:
-				print("   [DEBUG] Failed to stop Spotify via API before switching to YouTube.")
+				log.warning("Failed to stop Spotify via API before switching to YouTube.")
 				return
 			self._spotify_playing = False
 			self.current_platform = None
 
-		if track.platform != "spotify":
-			return super().play_track(track)
+		if platform != "spotify":
+			return await super().play_track_async(track)
 
 		print("\n▶️  Now Playing:")
-		print(f"   Platform: {track.platform.upper()}")
+		print(f"   Platform: {platform.upper()}")
 		print(f"   Title: {track.title}")
 		print(f"   Artist: {track.artist}")
 
 		# Ensure browser YouTube tab is closed before switching to Spotify desktop playback.
 		if self._youtube_playing and self._current_track_title:
-			self._close_browser_tab(self._current_track_title)
+			await asyncio.to_thread(self._close_browser_tab, self._current_track_title)
 
 		self._youtube_playing = False
 		self._spotify_playing = True
 		self.current_platform = "spotify"
 		self._current_track_title = track.title
 
-		api_ok = self._spotify_start_track(track)
+		api_ok = await asyncio.to_thread(self._spotify_start_track, track)
 		if api_ok:
 			print("   → Started via Spotify Web API")
-			time.sleep(0.8)
-			self._focus_spotify_app()
+			await _adelay(0.8)
+			await asyncio.to_thread(self._focus_spotify_app)
 		else:
-			print("   [DEBUG] Spotify API play failed. No fallback is enabled.")
+			log.warning("Spotify API play failed. No fallback is enabled.")
 			return
 
 		if track.duration:
@@ -333,19 +335,15 @@ class RandomPlayer(BrowserHybridPlayer):
 				timer_dur = max(0.5, track.duration * 0.9)
 			self._start_autoplay_timer(timer_dur)
 
-		self.played_tracks.append(track)
-		key = self._track_key(track)
-		self.play_counts[key] = self.play_counts.get(key, 0) + 1
-		print(f"   [DEBUG] Play count for '{key}': {self.play_counts[key]}")
-		self._save_play_counts()
+		self._record_play(track)
 
 	def stop_current(self, wait_after: bool = True):
 		"""Stop current track: close browser tab for YouTube, pause app for Spotify."""
-		if self._spotify_playing or self.current_platform == "spotify":
+		if self._spotify_active():
 			self._clear_autoplay_bookkeeping()
 			paused = self._spotify_pause()
 			if not paused:
-				print("   [DEBUG] Spotify API stop failed. No fallback is enabled.")
+				log.warning("Spotify API stop failed. No fallback is enabled.")
 				return
 
 			self._youtube_playing = False
@@ -354,32 +352,20 @@ class RandomPlayer(BrowserHybridPlayer):
 			self.current_platform = None
 
 			if wait_after:
-				time.sleep(0.2)
+				_delay(0.2)
 			return
 
 		return super().stop_current(wait_after=wait_after)
 
 	def pause_playback(self) -> bool:
 		"""Pause/unpause playback with Spotify API for Spotify tracks."""
-		if self._spotify_playing or (self.current_platform == "spotify"):
-			if self._autoplay_timer and not self._autoplay_paused:
-				if self._autoplay_start_time and self._autoplay_duration:
-					elapsed = time.time() - self._autoplay_start_time
-					remaining = self._autoplay_duration - elapsed
-				else:
-					remaining = None
-				self._autoplay_timer.cancel()
-				self._autoplay_timer = None
-				self._autoplay_remaining = None if remaining is None else max(0.1, float(remaining))
-				self._autoplay_paused = True
-			elif self._autoplay_paused and (self._autoplay_remaining is not None):
-				self._start_autoplay_timer(self._autoplay_remaining)
-				self._autoplay_remaining = None
-				self._autoplay_paused = False
+		if self._spotify_active():
+			if not self._pause_autoplay():
+				self._resume_autoplay()
 
 			toggled = self._spotify_toggle_playback()
 			if not toggled:
-				print("   [DEBUG] Spotify API pause/play failed. No fallback is enabled.")
+				log.warning("Spotify API pause/play failed. No fallback is enabled.")
 				return False
 			return True
 
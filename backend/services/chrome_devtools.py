@@ -0,0 +1,55 @@
+"""Minimal Chrome DevTools client for opening and closing tabs by id."""
+
+import json
+import logging
+import os
+import urllib.error
+import urllib.request
+from typing import Optional
+from urllib.parse import quote
+
+log = logging.getLogger(__name__)
+
+
+class ChromeDevTools:
+    """Talks to a Chrome/Edge started with --remote-debugging-port.
+
+    Only the HTTP endpoints are used (no websocket), which is enough to open a
+    tab, bring it to the front and close it by id rather than by title search.
+    """
+
+    def __init__(self, port: int, host: str = "127.0.0.1", timeout: float = 2.0):
+        self.base_url = f"http://{host}:{port}"
+        self.timeout = timeout
+
+    @classmethod
+    def from_env(cls) -> Optional["ChromeDevTools"]:
+        """Return a client if CHROME_REMOTE_DEBUGGING_PORT is set, else None."""
+        port = os.getenv("CHROME_REMOTE_DEBUGGING_PORT", "").strip()
+        if not port.isdigit():
+            return None
+        return cls(int(port))
+
+    def _request(self, path: str, method: str = "GET") -> str:
+        req = urllib.request.Request(self.base_url + path, method=method)
+        with urllib.request.urlopen(req, timeout=self.timeout) as resp:
+            return resp.read().decode("utf-8", errors="replace")
+
+    def open_tab(self, url: str) -> Optional[str]:
+        """Open `url` in a new foreground tab and return its target id, or None on failure."""
+        try:
+            info = json.loads(self._request("/json/new?" + quote(url, safe=":/?&=#%"), method="PUT"))
+            self._request(f"/json/activate/{info['id']}")
+        except (OSError, ValueError, KeyError, urllib.error.URLError) as e:
+            log.debug("DevTools open failed: %s", e)
+            return None
+        return info["id"]
+
+    def close_tab(self, tab_id: str) -> bool:
+        """Close the tab with `tab_id`. Returns False if it is already gone or the browser is unreachable."""
+        try:
+            self._request(f"/json/close/{tab_id}")
+        except (OSError, urllib.error.URLError) as e:
+            log.debug("DevTools close failed: %s", e)
+            return False
+        return True
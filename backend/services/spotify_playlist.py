@@ -1,77 +1,193 @@
 """Spotify playlist provider."""
 
 import re
+import time
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from dataclasses import replace
 from typing import Optional
 
+from backend.services.track_cache import TrackCache
 from models import Track
 
+# Only request the playlist item fields we read, 100 items per page (the API maximum).
+PLAYLIST_ITEMS_FIELDS = "items(track(id,name,artists(name),duration_ms,external_urls),added_by(id),added_at),next"
+PLAYLIST_ITEMS_PAGE_SIZE = 100
+
+_SP_PLAYLIST_PATTERNS = (
+    re.compile(r"playlist/([a-zA-Z0-9]+)"),
+    re.compile(r"playlist:([a-zA-Z0-9]+)"),
+)
+
+
+def call_with_backoff(fn, *args, max_attempts: int = 5, max_delay: float = 30.0, **kwargs):
+    """Call a spotipy method, retrying HTTP 429 responses.
+
+    Waits for the server's Retry-After (capped at `max_delay`) or, without
+    one, an exponential 1, 2, 4... second delay. Other errors, and a 429 on
+    the final attempt, are re-raised.
+    """
+    from spotipy.exceptions import SpotifyException
+
+    for attempt in range(max_attempts):
+        try:
+            return fn(*args, **kwargs)
+        except SpotifyException as exc:
+            if exc.http_status != 429 or attempt == max_attempts - 1:
+                raise
+            headers = getattr(exc, "headers", None) or {}
+            try:
+                delay = float(headers.get("Retry-After", 2**attempt))
+            except (TypeError, ValueError):
+                delay = float(2**attempt)
+            time.sleep(min(max(delay, 0.0), max_delay))
+
+
+def build_spotify_client(client_id: str, client_secret: str, pool_maxsize: int = 16):
+    """Create a client-credentials Spotify client backed by a pooled keep-alive session.
+
+    Reusing the returned client across refreshes avoids a new TLS handshake
+    per fetch; the pool is sized for the concurrent adder-name lookups.
+    """
+    import requests
+    import spotipy
+    from requests.adapters import HTTPAdapter
+    from spotipy.oauth2 import SpotifyClientCredentials
+
+    session = requests.Session()
+    session.mount("https://", HTTPAdapter(pool_connections=4, pool_maxsize=pool_maxsize))
+    auth_manager = SpotifyClientCredentials(client_id=client_id, client_secret=client_secret)
+    return spotipy.Spotify(auth_manager=auth_manager, requests_session=session)
+
 
 class SpotifyPlaylist:
     """Handles Spotify playlist extraction."""
 
-    def __init__(self, playlist_url: str, client_id: str, client_secret: str):
+    def __init__(
+        self,
+        playlist_url: str,
+        client_id: str,
+        client_secret: str,
+        cache: Optional[TrackCache] = None,
+    ):
         self.playlist_url = playlist_url
+        self.cache = cache
         self.client_id = client_id
         self.client_secret = client_secret
+        # spotipy client, created on first use unless injected via from_session()
+        self._sp = None
         self.tracks: list[Track] = []
-        # Cache mapping Spotify user id -> display name (to avoid repeated API calls)
+        # Cache mapping Spotify user id -> display name (to avoid repeated API calls).
+        # Read freely; bulk updates build a new dict and rebind it.
         self._user_display_cache: dict[str, str] = {}
 
+    @classmethod
+    def from_session(cls, playlist_url: str, sp, cache: Optional[TrackCache] = None) -> "SpotifyPlaylist":
+        """Create a provider that reuses an existing spotipy client."""
+        playlist = cls(playlist_url, "", "", cache=cache)
+        playlist._sp = sp
+        return playlist
+
+    def _client(self):
+        """Return the spotipy client, creating it once per provider."""
+        if self._sp is None:
+            self._sp = build_spotify_client(self.client_id, self.client_secret)
+        return self._sp
+
     def extract_playlist_id(self) -> Optional[str]:
         """Extract playlist ID from URL."""
-        patterns = [
-            r"playlist/([a-zA-Z0-9]+)",
-            r"playlist:([a-zA-Z0-9]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.playlist_url)
+        for pattern in _SP_PLAYLIST_PATTERNS:
+            match = pattern.search(self.playlist_url)
             if match:
                 return match.group(1)
         return None
 
+    def _resolve_user_names(self, sp, user_ids: set[str], max_workers: int = 8):
+        """Resolve display names for `user_ids` concurrently into the user cache.
+
+        The Web API has no bulk users endpoint, so each unique id costs one
+        request; ids already known from the persistent cache are skipped.
+        """
+        names = dict(self._user_display_cache)
+        if self.cache is not None:
+            for uid, data in self.cache.get_many("spotify_user", "", user_ids).items():
+                if data.get("display_name"):
+                    names[uid] = data["display_name"]
+        missing = [uid for uid in user_ids if uid not in names]
+        if not missing:
+            self._user_display_cache = names
+            return
+
+        def _fetch(uid: str) -> Optional[str]:
+            user = call_with_backoff(sp.user, uid)
+            return user.get("display_name") if isinstance(user, dict) else None
+
+        resolved: dict[str, dict] = {}
+        with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(missing)))) as ex:
+            futures = {ex.submit(_fetch, uid): uid for uid in missing}
+            for fut in as_completed(futures):
+                uid = futures[fut]
+                try:
+                    name = fut.result()
+                except Exception:
+                    name = None
+                if name:
+                    names[uid] = name
+                    resolved[uid] = {"display_name": name}
+        self._user_display_cache = names
+        if self.cache is not None:
+            self.cache.put_many("spotify_user", "", resolved)
+
     def fetch_tracks(self) -> list[Track]:
         """Fetch tracks from the playlist using Spotipy."""
         try:
-            import spotipy
-            from spotipy.oauth2 import SpotifyClientCredentials
-
             playlist_id = self.extract_playlist_id()
             if not playlist_id:
                 print("Error: Could not extract playlist ID from Spotify URL")
                 return []
 
-            auth_manager = SpotifyClientCredentials(
-                client_id=self.client_id,
-                client_secret=self.client_secret,
-            )
-            sp = spotipy.Spotify(auth_manager=auth_manager)
-
-            results = sp.playlist_tracks(playlist_id)
+            sp = self._client()
 
-            while results:
+            # Adder ids not known yet; resolved in one batch after pagination
+            pending_ids: set[str] = set()
+            offset = 0
+            while True:
+                # Page by offset rather than sp.next() so every request keeps the fields filter.
+                try:
+                    results = call_with_backoff(
+                        sp.playlist_items,
+                        playlist_id,
+                        fields=PLAYLIST_ITEMS_FIELDS,
+                        limit=PLAYLIST_ITEMS_PAGE_SIZE,
+                        offset=offset,
+                        additional_types=("track",),
+                    )
+                except Exception as e:
+                    if not self.tracks:
+                        raise
+                    # Keep the pages already collected rather than discarding them
+                    print(f"Error fetching Spotify playlist page at offset {offset}: {e}")
+                    break
+                cached: dict[str, dict] = {}
+                if self.cache is not None:
+                    page_ids = [(item.get("track") or {}).get("id") for item in results["items"]]
+                    cached = self.cache.get_many("spotify", playlist_id, [tid for tid in page_ids if tid])
                 for item in results["items"]:
                     track = item.get("track")
                     if track:
                         artists = ", ".join([a["name"] for a in track.get("artists", [])])
                         # Spotify API gives 'added_by' and 'added_at' on the playlist item.
-                        added_by = item.get("added_by") or {}
-                        added_by_id = added_by.get("id") if isinstance(added_by, dict) else None
+                        added_by_id = (item.get("added_by") or {}).get("id")
                         added_at = item.get("added_at")
                         added_by_name = None
-                        # Try to resolve display name via Spotify API (cached).
-                        if added_by_id:
-                            try:
-                                if added_by_id in self._user_display_cache:
-                                    added_by_name = self._user_display_cache[added_by_id]
-                                else:
-                                    user = sp.user(added_by_id)
-                                    name = user.get("display_name") if isinstance(user, dict) else None
-                                    if name:
-                                        added_by_name = name
-                                        self._user_display_cache[added_by_id] = name
-                            except Exception:
-                                added_by_name = added_by_id
                         track_id = track.get("id", "")
+                        hit = cached.get(track_id)
+                        if hit and hit.get("added_by_id") == added_by_id:
+                            added_by_name = hit.get("added_by_name")
+                        # Unknown adders are resolved in one batch after pagination.
+                        if added_by_id and added_by_name is None:
+                            added_by_name = self._user_display_cache.get(added_by_id)
+                            if added_by_name is None:
+                                pending_ids.add(added_by_id)
 
                         self.tracks.append(
                             Track(
@@ -89,10 +205,25 @@ class SpotifyPlaylist:
                             )
                         )
 
-                if results["next"]:
-                    results = sp.next(results)
-                else:
-                    results = None
+                if not results.get("next") or not results["items"]:
+                    break
+                offset += len(results["items"])
+
+            if pending_ids:
+                self._resolve_user_names(sp, pending_ids)
+
+            fresh: dict[str, dict] = {}
+            for i, t in enumerate(self.tracks):
+                if t.added_by_id and t.added_by_name is None:
+                    t = replace(t, added_by_name=self._user_display_cache.get(t.added_by_id, t.added_by_id))
+                    self.tracks[i] = t
+                track_id = t.uri.rsplit(":", 1)[-1] if t.uri else ""
+                if track_id and t.added_by_name and t.added_by_name != t.added_by_id:
+                    fresh[track_id] = {"added_by_id": t.added_by_id, "added_by_name": t.added_by_name}
+
+            if self.cache is not None:
+                self.cache.put_many("spotify", playlist_id, fresh)
+                self.cache.save()
 
             print(f"✓ Loaded {len(self.tracks)} tracks from Spotify playlist")
             return self.tracks
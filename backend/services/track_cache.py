@@ -0,0 +1,130 @@
+"""Disk-backed metadata cache shared by playlist providers."""
+
+import json
+import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Iterable
+
+
+class TrackCache:
+    """JSON-backed LRU cache of track metadata keyed by (platform, playlist_id, track_id).
+
+    Entries older than `ttl` seconds are treated as missing. The file is only
+    rewritten by `save()` when something changed since the last write.
+    """
+
+    def __init__(self, path: str, ttl: float = 7 * 24 * 3600, max_entries: int = 5000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entries = max_entries
+        self._lock = threading.Lock()
+        self._entries: "OrderedDict[str, tuple[float, dict]]" = OrderedDict()
+        self._dirty = False
+        self._load()
+
+    def _mark_dirty(self):
+        """Record an unsaved change (caller holds the lock)."""
+        self._dirty = True
+
+    @staticmethod
+    def _key(platform: str, playlist_id: str, track_id: str) -> str:
+        return f"{platform}:{playlist_id}:{track_id}"
+
+    def _load(self):
+        """Load non-expired entries from disk; a missing or corrupt file yields an empty cache."""
+        if not os.path.exists(self.path):
+            return
+        try:
+            with open(self.path, "r", encoding="utf-8") as f:
+                data = json.load(f)
+        except (OSError, ValueError):
+            return
+        if not isinstance(data, dict):
+            return
+        now = time.time()
+        for key, entry in data.items():
+            if not isinstance(entry, dict) or not isinstance(entry.get("data"), dict):
+                continue
+            try:
+                ts = float(entry.get("ts", 0))
+            except (TypeError, ValueError):
+                continue
+            if now - ts < self.ttl:
+                self._entries[str(key)] = (ts, entry["data"])
+
+    def get_many(self, platform: str, playlist_id: str, track_ids: Iterable[str]) -> dict[str, dict]:
+        """Return cached metadata for the given track ids that are present and fresh."""
+        now = time.time()
+        found: dict[str, dict] = {}
+        with self._lock:
+            for tid in track_ids:
+                key = self._key(platform, playlist_id, tid)
+                entry = self._entries.get(key)
+                if entry is None:
+                    continue
+                ts, data = entry
+                if now - ts >= self.ttl:
+                    del self._entries[key]
+                    self._mark_dirty()
+                    continue
+                self._entries.move_to_end(key)
+                found[tid] = data
+        return found
+
+    def put_many(self, platform: str, playlist_id: str, items: dict[str, dict]):
+        """Insert or replace metadata for the given track ids."""
+        if not items:
+            return
+        now = time.time()
+        with self._lock:
+            for tid, data in items.items():
+                key = self._key(platform, playlist_id, tid)
+                entry = self._entries.get(key)
+                if entry is not None and entry[1] == data:
+                    self._entries.move_to_end(key)
+                    continue
+                self._entries[key] = (now, dict(data))
+                self._entries.move_to_end(key)
+                self._mark_dirty()
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+                self._mark_dirty()
+
+    def refresh(self, track_id: str):
+        """Drop every cached entry for `track_id` so it is fetched again next time."""
+        suffix = f":{track_id}"
+        with self._lock:
+            stale = [k for k in self._entries if k.endswith(suffix)]
+            for key in stale:
+                del self._entries[key]
+            if stale:
+                self._mark_dirty()
+
+    def clear_cache(self):
+        """Remove all cached entries and delete the cache file."""
+        with self._lock:
+            self._entries.clear()
+            self._dirty = False
+            if os.path.exists(self.path):
+                os.remove(self.path)
+
+    def save(self, force: bool = False):
+        """Atomically write the cache to disk if it changed.
+
+        The write happens under the lock so concurrent saves never share the temp file.
+        """
+        with self._lock:
+            if not (self._dirty or force):
+                return
+            out = {key: {"ts": ts, "data": data} for key, (ts, data) in self._entries.items()}
+            buf = json.dumps(out, ensure_ascii=False).encode("utf-8")
+            tmp = self.path + ".tmp"
+            with open(tmp, "wb") as f:
+                f.write(buf)
+                f.flush()
+                os.fsync(f.fileno())
+            os.replace(tmp, self.path)
+            # Only clear the flag once the write succeeded
+            self._dirty = False
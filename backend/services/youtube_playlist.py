@@ -1,80 +1,162 @@
 """YouTube playlist provider."""
 
+import contextlib
 import re
+import threading
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from typing import Optional
 
+from backend.services.track_cache import TrackCache
 from models import Track
 
 
+_YT_PLAYLIST_PATTERNS = (
+    re.compile(r"list=([a-zA-Z0-9_-]+)"),
+    re.compile(r"playlist\?list=([a-zA-Z0-9_-]+)"),
+)
+
+
 class YouTubePlaylist:
     """Handles YouTube playlist extraction."""
 
-    def __init__(self, playlist_url: str):
+    def __init__(
+        self,
+        playlist_url: str,
+        resolve_missing_durations: bool = False,
+        cache: Optional[TrackCache] = None,
+    ):
         self.playlist_url = playlist_url
+        self.cache = cache
+        # When enabled, entries without a duration in the flat listing are
+        # resolved with one extra request per video.
+        self.resolve_missing_durations = resolve_missing_durations
         self.videos: list[Track] = []
 
     def extract_playlist_id(self) -> Optional[str]:
         """Extract playlist ID from URL."""
-        patterns = [
-            r"list=([a-zA-Z0-9_-]+)",
-            r"playlist\?list=([a-zA-Z0-9_-]+)",
-        ]
-        for pattern in patterns:
-            match = re.search(pattern, self.playlist_url)
+        for pattern in _YT_PLAYLIST_PATTERNS:
+            match = pattern.search(self.playlist_url)
             if match:
                 return match.group(1)
         return None
 
-    def fetch_videos(self) -> list[Track]:
-        """Fetch videos from the playlist using yt-dlp."""
+    def resolve_durations(self, video_ids: list[str], max_workers: int = 16) -> dict[str, Optional[float]]:
+        """Fetch durations for the given video ids concurrently.
+
+        yt-dlp instances are not safe to share across threads, so each
+        worker lazily creates its own.
+        """
+        import yt_dlp
+
+        ydl_opts = {
+            "quiet": True,
+            "no_warnings": True,
+            "skip_download": True,
+        }
+        local = threading.local()
+        created: list = []
+        created_lock = threading.Lock()
+
+        def _fetch(video_id: str) -> Optional[float]:
+            ydl = getattr(local, "ydl", None)
+            if ydl is None:
+                ydl = yt_dlp.YoutubeDL(ydl_opts)
+                local.ydl = ydl
+                with created_lock:
+                    created.append(ydl)
+            info = ydl.extract_info(f"https://www.youtube.com/watch?v={video_id}", download=False)
+            return info.get("duration") if info else None
+
+        durations: dict[str, Optional[float]] = {}
+        try:
+            with ThreadPoolExecutor(max_workers=max(1, min(max_workers, len(video_ids)))) as ex:
+                futures = {ex.submit(_fetch, vid): vid for vid in video_ids}
+                for fut in as_completed(futures):
+                    try:
+                        durations[futures[fut]] = fut.result()
+                    except Exception:
+                        durations[futures[fut]] = None
+        finally:
+            for ydl in created:
+                with contextlib.suppress(Exception):
+                    ydl.close()
+        return durations
+
+    def fetch_videos(self, silent: bool = False) -> list[Track]:
+        """Fetch videos from the playlist using yt-dlp.
+
+        With `silent`, nothing is printed and fetch errors propagate to the
+        caller instead of returning an empty list.
+        """
         try:
             import yt_dlp
 
             playlist_id = self.extract_playlist_id()
             if not playlist_id:
-                print("Error: Could not extract playlist ID from URL")
+                if not silent:
+                    print("Error: Could not extract playlist ID from URL")
                 return []
 
+            # A flat listing returns title/uploader/duration for every entry
+            # in a single playlist request.
             ydl_opts = {
                 "quiet": True,
                 "no_warnings": True,
+                "extract_flat": True,
                 "skip_download": True,
             }
 
             with yt_dlp.YoutubeDL(ydl_opts) as ydl:
                 result = ydl.extract_info(self.playlist_url, download=False)
 
-                if result and "entries" in result:
-                    for entry in result["entries"]:
-                        if entry:
-                            video_id = entry.get("id", "")
-                            title = entry.get("title", "Unknown Title")
-                            uploader = entry.get("uploader", "Unknown Artist")
-                            duration = entry.get("duration")
-                            # If duration is not present, try to fetch video info.
-                            if duration is None and video_id:
-                                try:
-                                    info = ydl.extract_info(
-                                        f"https://www.youtube.com/watch?v={video_id}",
-                                        download=False,
-                                    )
-                                    duration = info.get("duration")
-                                except Exception:
-                                    duration = None
-
-                            self.videos.append(
-                                Track(
-                                    title=title,
-                                    artist=uploader,
-                                    platform="youtube",
-                                    url=f"https://www.youtube.com/watch?v={video_id}",
-                                    duration=float(duration) if duration else None,
-                                )
+            entries = []
+            if result and "entries" in result:
+                for entry in result["entries"]:
+                    if entry:
+                        entries.append(
+                            (
+                                entry.get("id", ""),
+                                entry.get("title", "Unknown Title"),
+                                entry.get("uploader", "Unknown Artist"),
+                                entry.get("duration"),
                             )
+                        )
+
+            missing = [vid for vid, _, _, duration in entries if duration is None and vid]
+            durations: dict[str, Optional[float]] = {}
+            if missing and self.cache is not None:
+                cached = self.cache.get_many("youtube", playlist_id, missing)
+                durations = {vid: data.get("duration") for vid, data in cached.items()}
+                missing = [vid for vid in missing if durations.get(vid) is None]
+            if missing and self.resolve_missing_durations:
+                durations.update(self.resolve_durations(missing))
+
+            fresh: dict[str, dict] = {}
+            for video_id, title, uploader, duration in entries:
+                if duration is None:
+                    duration = durations.get(video_id)
+                if video_id and duration:
+                    fresh[video_id] = {"title": title, "artist": uploader, "duration": duration}
+                self.videos.append(
+                    Track(
+                        title=title,
+                        artist=uploader,
+                        platform="youtube",
+                        url=f"https://www.youtube.com/watch?v={video_id}",
+                        duration=float(duration) if duration else None,
+                    )
+                )
+
+            if self.cache is not None:
+                self.cache.put_many("youtube", playlist_id, fresh)
+                self.cache.save()
 
-            print(f"✓ Loaded {len(self.videos)} videos from YouTube playlist")
+            if not silent:
+                print(f"✓ Loaded {len(self.videos)} videos from YouTube playlist")
             return self.videos
 
         except Exception as e:
+            if silent:
+                raise
             print(f"Error fetching YouTube playlist: {e}")
             return []
@@ -4,9 +4,12 @@ from dataclasses import dataclass
 from typing import Optional
 
 
-@dataclass
+@dataclass(slots=True, frozen=True)
 class Track:
-    """Represents a track from either platform."""
+    """Represents a track from either platform.
+
+    Instances are immutable; use ``dataclasses.replace`` to derive a modified copy.
+    """
 
     title: str
     artist: str
@@ -18,3 +21,10 @@ class Track:
     added_by_id: Optional[str] = None
     added_by_name: Optional[str] = None
     added_at: Optional[str] = None
+
+    def __post_init__(self):
+        # Display code slices title/artist directly, so normalise missing values to ""
+        if not isinstance(self.title, str):
+            object.__setattr__(self, "title", "" if self.title is None else str(self.title))
+        if not isinstance(self.artist, str):
+            object.__setattr__(self, "artist", "" if self.artist is None else str(self.artist))
@@ -1,11 +1,14 @@
 """Random Playlist Player launcher."""
 
-import io
+import atexit
+import contextlib
+import functools
+import logging
+import logging.handlers
 import os
-import random
-from contextlib import redirect_stdout
+import queue
+from itertools import zip_longest
 
-import qrcode
 from dotenv import load_dotenv
 
 from backend.player_core_desktop import RandomPlayer as PlayerCore
@@ -14,21 +17,62 @@ from backend.player_core_desktop import RandomPlayer as PlayerCore
 load_dotenv()
 
 
-def get_qr_lines(url: str) -> list[str]:
-    """Generate QR code ASCII lines for a URL."""
+# Glyphs used by qrcode's print_ascii for (top, bottom) module pairs:
+# neither, top only, bottom only, both.
+_QR_HALF_BLOCKS = ("\xa0", "\u2580", "\u2584", "\u2588")
+
+
+@functools.lru_cache(maxsize=256)
+def _cached_qr_lines(url: str) -> tuple[str, ...]:
+    """Render QR code ASCII lines for a URL (memoized; the output only depends on the URL).
+
+    Builds the same half-block art as ``QRCode.print_ascii`` straight from the
+    module matrix, two module rows per text line.
+    """
+    import qrcode
+
     qr = qrcode.QRCode(version=1, box_size=1, border=1)
     qr.add_data(url)
     qr.make(fit=True)
-    f = io.StringIO()
-    with redirect_stdout(f):
-        qr.print_ascii()
-    ascii_str = f.getvalue()
-    lines = ascii_str.split("\n")
-    return lines
+    matrix = qr.get_matrix()
+    size = len(matrix)
+    blank = [False] * size
+    lines = []
+    for r in range(0, size, 2):
+        top = matrix[r]
+        bottom = matrix[r + 1] if r + 1 < size else blank
+        lines.append("".join(_QR_HALF_BLOCKS[t + (b << 1)] for t, b in zip(top, bottom)))
+    return tuple(lines)
+
+
+def get_qr_lines(url: str) -> list[str]:
+    """Generate QR code ASCII lines for a URL."""
+    return list(_cached_qr_lines(url))
+
+
+def _setup_logging():
+    """Route backend log records through a queue so writing to the console happens off the caller's thread.
+
+    Debug output from the backend and ui packages is off unless SYTKTV_DEBUG is set.
+    """
+    records: queue.SimpleQueue = queue.SimpleQueue()
+    console = logging.StreamHandler()
+    console.setFormatter(logging.Formatter("   [%(levelname)s] %(message)s"))
+    listener = logging.handlers.QueueListener(records, console)
+    root = logging.getLogger()
+    root.addHandler(logging.handlers.QueueHandler(records))
+    root.setLevel(logging.WARNING)
+    # SYTKTV_DEBUG only turns on the app's own loggers, not urllib3/spotipy/asyncio/PIL
+    if os.getenv("SYTKTV_DEBUG"):
+        for name in ("backend", "ui"):
+            logging.getLogger(name).setLevel(logging.DEBUG)
+    listener.start()
+    atexit.register(listener.stop)
 
 
 def main():
     """Main entry point."""
+    _setup_logging()
     print("=" * 50)
     print("🎶 Random Playlist Player")
     print("   YouTube + Spotify Edition")
@@ -68,50 +112,40 @@ def main():
     # Start auto-refresh
     player.start_auto_refresh()
     # Start Next Up GUI (replaces next_up.txt)
-    try:
+    with contextlib.suppress(Exception):
         player.start_menu_window()
-    except Exception:
-        pass
-
-    # Generate and display QR codes for playlist links
-    if youtube_url:
-        print("\n📱 YouTube Playlist QR Code:")
-        qr = qrcode.QRCode(version=1, box_size=1, border=1)
-        qr.add_data(youtube_url)
-        qr.make(fit=True)
-        qr.print_ascii()
-
-    if spotify_url:
-        print("\n📱 Spotify Playlist QR Code:")
-        qr = qrcode.QRCode(version=1, box_size=1, border=1)
-        qr.add_data(spotify_url)
-        qr.make(fit=True)
-        qr.print_ascii()
+
+    # The playlist URLs never change, so render the QR art once; each block goes out in one write
+    spotify_lines = get_qr_lines(spotify_url) if spotify_url else []
+    youtube_lines = get_qr_lines(youtube_url) if youtube_url else []
+
+    # Display QR codes for playlist links
+    if youtube_lines:
+        print("\n📱 YouTube Playlist QR Code:\n" + "\n".join(youtube_lines))
+
+    if spotify_lines:
+        print("\n📱 Spotify Playlist QR Code:\n" + "\n".join(spotify_lines))
+
+    if spotify_lines and youtube_lines:
+        qr_block = "\n📱 Spotify Playlist QR Code    📱 YouTube Playlist QR Code\n" + "\n".join(
+            f"{s_line}    {y_line}" for s_line, y_line in zip_longest(spotify_lines, youtube_lines, fillvalue="")
+        )
+    elif spotify_lines:
+        qr_block = "\n📱 Spotify Playlist QR Code:\n" + "\n".join(spotify_lines)
+    elif youtube_lines:
+        qr_block = "\n📱 YouTube Playlist QR Code:\n" + "\n".join(youtube_lines)
+    else:
+        qr_block = ""
 
     # Main loop
     while True:
         # Always display QR codes and commands
-        spotify_lines = get_qr_lines(spotify_url) if spotify_url else []
-        youtube_lines = get_qr_lines(youtube_url) if youtube_url else []
-
-        if spotify_lines and youtube_lines:
-            print("\n📱 Spotify Playlist QR Code    📱 YouTube Playlist QR Code")
-            max_len = max(len(spotify_lines), len(youtube_lines))
-            for i in range(max_len):
-                s_line = spotify_lines[i] if i < len(spotify_lines) else ""
-                y_line = youtube_lines[i] if i < len(youtube_lines) else ""
-                print(f"{s_line}    {y_line}")
-        elif spotify_lines:
-            print("\n📱 Spotify Playlist QR Code:")
-            for line in spotify_lines:
-                print(line)
-        elif youtube_lines:
-            print("\n📱 YouTube Playlist QR Code:")
-            for line in youtube_lines:
-                print(line)
-
-        if player._queue:
-            next_track = player._queue[0]
+        if qr_block:
+            print(qr_block)
+
+        with player._playlist_lock:
+            next_track = player._queue[0] if player._queue else None
+        if next_track is not None:
             print(f"  Next up: {next_track.title} by {next_track.artist} ")
             player.update_menu_file()
         print("=" * 50)
@@ -120,9 +154,13 @@ def main():
 
         if choice.isdigit():
             idx = int(choice) - 1
-            if 0 <= idx < len(player._queue):
-                track = player._queue.pop(idx)
-                player._queue.insert(0, track)
+            # The Next Up window and playback threads edit the queue too
+            with player._playlist_lock:
+                track = player._queue[idx] if 0 <= idx < len(player._queue) else None
+                if track is not None:
+                    del player._queue[idx]
+                    player._queue.appendleft(track)
+            if track is not None:
                 print(f"Moved '{track.title}' to front of queue.")
                 player.update_menu_file()
             else:
@@ -131,10 +169,8 @@ def main():
             player.stop_current(wait_after=False)
             player.stop_auto_refresh()
             # Stop NextUp GUI if running
-            try:
+            with contextlib.suppress(Exception):
                 player.stop_menu_window()
-            except Exception:
-                pass
             print("\n👋 Goodbye!")
             break
         elif choice == "x":
@@ -146,13 +182,16 @@ def main():
         elif choice == "adder":
             player.toggle_show_adder_menu()
         elif choice == "shuffle":
-            random.shuffle(player._queue)
+            player.shuffle_queue()
             print("Queue shuffled.")
             player.update_menu_file()
         elif choice == "p":
-            if player._queue:
+            # Iterate a copy: a deque raises if another thread mutates it mid-iteration
+            with player._playlist_lock:
+                queued = list(player._queue)
+            if queued:
                 print("\n📋 Queue:")
-                for i, track in enumerate(player._queue, 1):
+                for i, track in enumerate(queued, 1):
                     print(f"  {i}. {track.title} by {track.artist} ({track.platform.upper()})")
             else:
                 print("\n📋 Queue is empty.")
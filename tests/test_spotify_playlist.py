@@ -0,0 +1,72 @@
+"""Tests for the Spotify playlist provider."""
+
+import importlib.util
+import unittest
+
+from backend.services.spotify_playlist import SpotifyPlaylist
+
+HAS_SPOTIPY = importlib.util.find_spec("spotipy") is not None
+
+
+class StubSpotify:
+    """Minimal stand-in for spotipy.Spotify serving fixed playlist pages."""
+
+    def __init__(self, pages, users):
+        self.pages = pages
+        self.users = users
+        self.user_calls = []
+
+    def playlist_items(self, playlist_id, fields=None, limit=100, offset=0, additional_types=None):
+        return self.pages[offset]
+
+    def user(self, uid):
+        self.user_calls.append(uid)
+        return {"display_name": self.users[uid]}
+
+
+def _item(track_id, name, adder):
+    return {
+        "track": {
+            "id": track_id,
+            "name": name,
+            "artists": [{"name": "Artist"}],
+            "duration_ms": 180000,
+            "external_urls": {"spotify": f"https://open.spotify.com/track/{track_id}"},
+        },
+        "added_by": {"id": adder},
+        "added_at": "2024-01-01T00:00:00Z",
+    }
+
+
+@unittest.skipUnless(HAS_SPOTIPY, "spotipy not installed")
+class FetchTracksTest(unittest.TestCase):
+    def test_fetch_tracks_pages_and_resolves_adders_once(self):
+        pages = {
+            0: {"items": [_item("a", "Song A", "u1"), _item("b", "Song B", "u2")], "next": "more"},
+            2: {"items": [_item("c", "Song C", "u1")], "next": None},
+        }
+        sp = StubSpotify(pages, {"u1": "Alice", "u2": "Bob"})
+        playlist = SpotifyPlaylist.from_session("https://open.spotify.com/playlist/abc123", sp)
+
+        tracks = playlist.fetch_tracks()
+
+        self.assertEqual([t.title for t in tracks], ["Song A", "Song B", "Song C"])
+        self.assertEqual([t.added_by_name for t in tracks], ["Alice", "Bob", "Alice"])
+        self.assertEqual(tracks[0].uri, "spotify:track:a")
+        self.assertEqual(tracks[0].duration, 180.0)
+        self.assertEqual(sorted(sp.user_calls), ["u1", "u2"])
+
+    def test_fetch_tracks_with_all_adders_known(self):
+        pages = {0: {"items": [_item("a", "Song A", "u1")], "next": None}}
+        sp = StubSpotify(pages, {})
+        playlist = SpotifyPlaylist.from_session("https://open.spotify.com/playlist/abc123", sp)
+        playlist._user_display_cache = {"u1": "Alice"}
+
+        tracks = playlist.fetch_tracks()
+
+        self.assertEqual([t.added_by_name for t in tracks], ["Alice"])
+        self.assertEqual(sp.user_calls, [])
+
+
+if __name__ == "__main__":
+    unittest.main()
@@ -1,23 +1,63 @@
 """Tkinter Next Up window for playlist player."""
 
+import concurrent.futures
+import contextlib
+import logging
 import os
-import random
 import threading
 from typing import Optional
 
 import pyautogui
 
+log = logging.getLogger(__name__)
+
 
 class Menu:
 	"""A small Tkinter window that displays the upcoming queue and refreshes automatically."""
 
+	# Line height of the list font, measured once per process (Font objects themselves belong to one Tk root)
+	_list_row_h: Optional[int] = None
+
 	def __init__(self, player: "RandomPlayer"):
 		self.player = player
 		self._thread: Optional[threading.Thread] = None
 		self.root = None
 		self._running = threading.Event()
 		self._top_lbl = None
-		self._listbox = None
+		# Toolbar buttons by key, filled in when the window is built
+		self._buttons: dict[str, object] = {}
+		# Coalesces schedule_update bursts into one render per interval
+		self._update_lock = threading.Lock()
+		self._pending_snapshot: Optional[list] = None
+		self._update_scheduled = False
+		self._min_interval_ms = 50
+		# Rows drawn in the tree; tracks further down the queue are not shown
+		self._max_visible = 50
+		# Runs the VR/refresh automation (and cursor moves) so button clicks return immediately
+		self._io_executor = concurrent.futures.ThreadPoolExecutor(max_workers=1, thread_name_prefix="nextup-io")
+		# Tracks currently shown in the tree, for diffing the next render
+		self._last_row_tracks: list = []
+		# Treeview iid -> queue index of the row, for the drag/double-click handlers
+		self._iid_to_index: dict[str, int] = {}
+		# Adder toggle the tree's displaycolumns were last set for
+		self._displayed_adder: Optional[bool] = None
+		# (show_adder, tracks) of the last render; holds the tracks so the comparison stays valid
+		self._last_render_key: Optional[tuple] = None
+		# id(track) -> (track, display strings); the track reference guards against id reuse
+		self._display_cache: dict[int, tuple] = {}
+		# (bucketed width, show_adder) last applied to the tree, and the measured width it was sized for
+		self._applied_reflow_key: Optional[tuple[int, bool]] = None
+		self._applied_reflow_width = 0
+		# after() id of a debounced <Configure> reflow, if one is pending
+		self._reflow_pending: Optional[str] = None
+		# Latest drag y position, coalesced into one row lookup per idle tick
+		self._motion_y = 0
+		self._motion_scheduled = False
+		self._last_over_iid: Optional[str] = None
+		# (path, mtime, height) -> PhotoImage of QR codes already scaled for display
+		self._qr_photo_cache: dict[tuple[str, float, int], object] = {}
+		# Bumped by every QR toggle; loads started under an older token are dropped
+		self._qr_load_token = 0
 
 	def start(self):
 		if self._thread and self._thread.is_alive():
@@ -32,118 +72,120 @@ class Menu:
 			self.root.quit()
 
 
-	def schedule_update(self, queue_snapshot: list):
-		"""Schedule an immediate UI update from any thread.
+	def schedule_update(self, queue_snapshot: Optional[list] = None):
+		"""Schedule a UI update from any thread.
 
-		Displays the first track in a fixed label and fills the queue view
-		with the remaining entries.
+		Bursts of calls are coalesced: only the latest snapshot is rendered,
+		at most once per `_min_interval_ms`. Without a snapshot the player's
+		queue is copied when the render runs, so a burst costs one copy.
 		"""
-		try:
-			if not self.root:
+		if not self.root:
+			return
+		with self._update_lock:
+			self._pending_snapshot = queue_snapshot
+			if self._update_scheduled:
 				return
-			def _update():
-				top_lbl = getattr(self, "_top_lbl", None)
-				tree = getattr(self, "_tree", None)
-				listbox = getattr(self, "_listbox", None)
-				# require top area and at least one of tree/listbox
-				if top_lbl is None or (tree is None and listbox is None):
-					return
-				# Update top "Next up"
-				if not queue_snapshot:
-					top_lbl.config(text="Next up: (none)")
-					listbox.delete(0, "end")
-					return
-
-				first = queue_snapshot[0]
-				title_short = (first.title[:30]) if first.title else ""
-				artist_short = (first.artist[:20]) if first.artist else ""
-
-				# Support both Label and Text widgets for the top area.
-				# Build top text; if adder display is enabled, add second line with adder
-				top_text = f"Next: {title_short} — {artist_short}"
-				if getattr(self.player, "_show_adder_nextup", False):
-					ab = getattr(first, "added_by_name", None) or getattr(first, "added_by_id", None)
-					if ab:
-						try:
-							ab_short = ab[:30] if isinstance(ab, str) else str(ab)
-						except Exception:
-							ab_short = str(ab)
-						top_text = top_text + "\nAdded by: " + ab_short
-
-				# If it's a Text widget, replace contents and keep it readonly
-				if hasattr(top_lbl, "delete") and hasattr(top_lbl, "insert"):
-						top_lbl.config(state="normal")
-						top_lbl.delete("1.0", "end")
-						top_lbl.insert("1.0", top_text)
-						top_lbl.config(state="disabled")
-				else:
-					top_lbl.config(text=top_text)
-					top_lbl.config(text=f"Next: {title_short} — {artist_short}")
-
-				# Prepare list of tracks
-				rest = []
-				# Enumerate tracks and show 1-based ordinals (1,2,3,...).
-				# The top area still highlights the first item, but the
-				# table/list will include it as well.
-				for idx, t in enumerate(queue_snapshot, start=1):
-					t_title = t.title[:30] if t.title else ""
-					t_artist = t.artist[:20] if t.artist else ""
-
-					# Fixed-width index (right-aligned 3 chars) with dot and a space
-					prefix = f"{idx:>3}. "
-					# Build fixed-width table columns for index, title, artist, optional adder
-					if getattr(self.player, "_show_adder_nextup", False):
-						ab = getattr(t, "added_by_name", None) or getattr(t, "added_by_id", None)
-						ab_short = ""
-						if ab:
-							ab_short = (ab[:18]) if isinstance(ab, str) else str(ab)
-						line = f"{prefix}{t_title:<30} {t_artist:<20} {ab_short:<18}"
-					else:
-						line = f"{prefix}{t_title:<30} {t_artist:<20}"
-					rest.append(line)
-
-				# Update header to reflect current adder toggle
-				hdr = getattr(self, "_header_lbl", None)
-				if hdr is not None:
-					show_adder = getattr(self.player, "_show_adder_nextup", False)
-					header_text = f"{'#':>3}. {'Title':30} {'Artist':20} {'Adder' if show_adder else ''}"
-					hdr.config(text=header_text)
-
-				# Update tree/listbox contents
-				if tree is not None:
-					# show/hide adder column based on toggle
-					if getattr(self.player, "_show_adder_nextup", False):
-						tree["displaycolumns"] = ("idx", "title", "artist", "adder")
-					else:
-						tree["displaycolumns"] = ("idx", "title", "artist")
-					for ch in tree.get_children():
-						tree.delete(ch)
-
-					# Adjust column widths when adder column is toggled so the
-					# visible columns reflow to sensible sizes.
-					show_adder = getattr(self.player, "_show_adder_nextup", False)
-					self._reflow_columns(getattr(self, "_tree", None), show_adder)
-
-					# Insert rows into tree; rest already contains formatted lines but we also insert structured values if available
-					for i, t in enumerate(queue_snapshot, start=1):
-						title_short = (t.title[:30]) if t.title else ""
-						artist_short = (t.artist[:20]) if t.artist else ""
-						ab = getattr(t, "added_by_name", None) or getattr(t, "added_by_id", None)
-						ab_short = ""
-						if getattr(self.player, "_show_adder_nextup", False) and ab:
-							ab_short = (ab[:18]) if isinstance(ab, str) else str(ab)
-
-						try:
-							tree.insert("", "end", iid=str(i), values=(i, title_short, artist_short, ab_short))
-						except Exception:
-							tree.insert("", "end", values=(i, title_short, artist_short, ab_short))
-				else:
-					listbox.delete(0, "end")
-					for item in rest:
-						listbox.insert("end", item)
-			self.root.after(0, _update)
+			self._update_scheduled = True
+		# Only the Tk call can fail (window closing or not yet in mainloop)
+		try:
+			self.root.after(self._min_interval_ms, self._flush_update)
 		except Exception:
-			pass
+			# Nothing was armed, so let the next call try again
+			with self._update_lock:
+				self._update_scheduled = False
+
+	def _flush_update(self):
+		"""Render the most recent pending snapshot (runs on the Tk thread)."""
+		with self._update_lock:
+			queue_snapshot = self._pending_snapshot
+			self._pending_snapshot = None
+			self._update_scheduled = False
+		if queue_snapshot is None:
+			with self.player._playlist_lock:
+				queue_snapshot = list(self.player._queue)
+		self._render(queue_snapshot)
+
+	def _render(self, queue_snapshot: list):
+		"""Display the first track in a fixed label and fill the queue view
+		with the remaining entries.
+		"""
+		top_lbl = getattr(self, "_top_lbl", None)
+		tree = getattr(self, "_tree", None)
+		if top_lbl is None or tree is None:
+			return
+		# Only the head of the queue is drawn, so render cost doesn't grow with queue length
+		queue_snapshot = queue_snapshot[: self._max_visible]
+		# Nothing to redraw if the same tracks are shown with the same adder setting.
+		# Tuple equality checks identity first, so an unchanged queue compares cheaply.
+		show_adder = bool(getattr(self.player, "_show_adder_nextup", False))
+		render_key = (show_adder, tuple(queue_snapshot))
+		if render_key == self._last_render_key:
+			return
+		self._last_render_key = render_key
+		# Update top "Next up"; an empty queue still goes through the row diff below so stale rows are removed
+		if queue_snapshot:
+			first = queue_snapshot[0]
+			title_short, artist_short, _ = self._disp(first)
+
+			# Build top text; if adder display is enabled, add second line with adder
+			top_text = f"Next: {title_short} — {artist_short}"
+			if show_adder:
+				ab = first.added_by_name or first.added_by_id
+				if ab:
+					top_text = top_text + "\nAdded by: " + ab[:30]
+		else:
+			top_text = "Next up: (none)"
+
+		# Support both Label and Text widgets for the top area.
+		# If it's a Text widget, replace contents and keep it readonly
+		if hasattr(top_lbl, "delete") and hasattr(top_lbl, "insert"):
+			top_lbl.config(state="normal")
+			top_lbl.delete("1.0", "end")
+			top_lbl.insert("1.0", top_text)
+			top_lbl.config(state="disabled")
+		else:
+			top_lbl.config(text=top_text)
+
+		# Rows always carry the adder value; the toggle only flips which columns are
+		# displayed and reflows their widths (resizes reflow via <Configure>)
+		if show_adder != self._displayed_adder:
+			if show_adder:
+				tree["displaycolumns"] = ("idx", "title", "artist", "adder")
+			else:
+				tree["displaycolumns"] = ("idx", "title", "artist")
+			self._reflow_columns(tree, show_adder)
+			self._displayed_adder = show_adder
+
+		# Touch only positions whose track changed, comparing identities rather than
+		# formatted strings; _iid_to_index maps each row back to its queue position
+		old_tracks = self._last_row_tracks
+		for i, t in enumerate(queue_snapshot):
+			if i < len(old_tracks) and old_tracks[i] is t:
+				continue
+			row = (i + 1, *self._disp(t))
+			if i < len(old_tracks):
+				tree.item(str(i + 1), values=row)
+			else:
+				tree.insert("", "end", iid=str(i + 1), values=row)
+				self._iid_to_index[str(i + 1)] = i
+		for i in range(len(queue_snapshot), len(old_tracks)):
+			tree.delete(str(i + 1))
+			self._iid_to_index.pop(str(i + 1), None)
+		self._last_row_tracks = list(queue_snapshot)
+
+		# Forget display strings for tracks that have left the queue
+		if len(self._display_cache) > 2 * len(queue_snapshot) + 64:
+			self._display_cache = {id(t): self._display_cache[id(t)] for t in queue_snapshot if id(t) in self._display_cache}
+
+	def _disp(self, t) -> tuple[str, str, str]:
+		"""Return the truncated (title, artist, adder) shown for a track, computed once per track."""
+		entry = self._display_cache.get(id(t))
+		if entry is not None and entry[0] is t:
+			return entry[1]
+		ab = t.added_by_name or t.added_by_id or ""
+		disp = (t.title[:30], t.artist[:20], ab[:18])
+		self._display_cache[id(t)] = (t, disp)
+		return disp
 
 	def _reflow_columns(self, tree, show_adder: bool):
 		"""Set Treeview column widths as percentages of available width.
@@ -157,6 +199,12 @@ class Menu:
 		if total_w < 50:
 			total_w = self.root.winfo_width() if self.root is not None else 1080
 
+		# Skip small resizes within the same 20 px bucket, unless the tree shrank below
+		# the width the current columns were sized for (they would overflow it)
+		key = (round(total_w / 20) * 20, bool(show_adder))
+		if key == self._applied_reflow_key and total_w >= self._applied_reflow_width:
+			return
+
 		# Reserve a bit for vertical scrollbar and padding
 		vsb_reserve = 20
 		padding = 24
@@ -176,15 +224,16 @@ class Menu:
 		idx_w = max(30, int(avail * idx_pct))
 		title_w = max(120, int(avail * title_pct))
 		artist_w = max(80, int(avail * artist_pct))
-
+		adder_w = max(60, int(avail * adder_pct)) if show_adder else 0
 		tree.column("idx", width=idx_w, anchor="e")
 		tree.column("title", width=title_w, anchor="w")
 		tree.column("artist", width=artist_w, anchor="w")
 		if show_adder:
-			adder_w = max(60, int(avail * adder_pct))
 			tree.column("adder", width=adder_w, anchor="w")
 		else:
 			tree.column("adder", width=0)
+		self._applied_reflow_key = key
+		self._applied_reflow_width = total_w
 
 	def _run(self):
 		try:
@@ -192,11 +241,11 @@ class Menu:
 			import tkinter.font as tkfont
 			from tkinter import ttk
 		except Exception as e:
-			print(f"[Menu] Failed to import tkinter UI dependencies: {e}")
+			log.warning("[Menu] Failed to import tkinter UI dependencies: %s", e)
 			return
 
 		def _report(context: str, err: Exception):
-			print(f"[Menu] {context}: {err}")
+			log.warning("[Menu] %s: %s", context, err)
 
 		try:
 			self.root = tk.Tk()
@@ -227,10 +276,10 @@ class Menu:
 
 			def _shuffle_queue():
 				try:
-					with self.player._playlist_lock:
-						random.shuffle(self.player._queue)
+					# shuffle_queue hands back the order it produced, so render that directly
+					snapshot = self.player.shuffle_queue()
 					print("Queue shuffled (NextUp window)")
-					self.player.update_menu_file()
+					self.schedule_update(snapshot)
 				except Exception as e:
 					_report("Shuffle queue failed", e)
 
@@ -244,35 +293,41 @@ class Menu:
 			def _pause_playback():
 				try:
 					res = self.player.pause_playback()
-					print(f"Playback pause/unpause attempted: {res}")
+					log.debug("Playback pause/unpause attempted: %s", res)
 				except Exception as e:
 					_report("Pause playback failed", e)
 
+			def _automate_then_return(btn, action, context: str):
+				"""Run a blocking automation `action` on the worker thread, then park the cursor back on `btn`."""
+				# Widget geometry must be read on the Tk thread
+				btn_center = (btn.winfo_rootx() + btn.winfo_width() // 2, btn.winfo_rooty() + btn.winfo_height() // 2)
+
+				def _job():
+					try:
+						action()
+						pyautogui.moveTo(btn_center[0], btn_center[1])
+					except Exception as e:
+						_report(context, e)
+
+				self._io_executor.submit(_job)
+
 			def _reset_vr():
-				try:
-					bx = b_reset.winfo_rootx()
-					by = b_reset.winfo_rooty()
-					bw = b_reset.winfo_width()
-					bh = b_reset.winfo_height()
-					btn_center = (bx + bw // 2, by + bh // 2)
+				def _action():
 					self.player.perform_vr_reset()
-					pyautogui.FAILSAFE = False
-					pyautogui.moveTo(btn_center[0], btn_center[1])
 					print("VR reset triggered from NextUp window")
+
+				try:
+					_automate_then_return(self._buttons["reset"], _action, "VR reset failed")
 				except Exception as e:
 					_report("VR reset failed", e)
 
 			def _refresh_tab():
-				try:
-					bx = b_refresh.winfo_rootx()
-					by = b_refresh.winfo_rooty()
-					bw = b_refresh.winfo_width()
-					bh = b_refresh.winfo_height()
-					btn_center = (bx + bw // 2, by + bh // 2)
+				def _action():
 					res = self.player.refresh_current_tab()
-					print(f"Refresh attempted: {res}")
-					pyautogui.FAILSAFE = False
-					pyautogui.moveTo(btn_center[0], btn_center[1])
+					log.debug("Refresh attempted: %s", res)
+
+				try:
+					_automate_then_return(self._buttons["refresh"], _action, "Refresh tab failed")
 				except Exception as e:
 					_report("Refresh tab failed", e)
 
@@ -283,53 +338,111 @@ class Menu:
 				except Exception as e:
 					_report("Toggle adder failed", e)
 
-			def _toggle_qr_display():
+			def _load_qr(qr_dir, entries, token: int):
+				"""Decode and scale the QR images off the Tk thread, then hand them back to it.
+
+				Scaled copies are kept in `qr_dir/.cache` so later shows skip the resize.
+				Stops early once `token` is superseded by a newer toggle.
+				"""
+				import hashlib
+				from PIL import Image
+
+				results = []
 				try:
-					if getattr(self, "_qr_frame", None) and getattr(self, "_qr_visible", False):
-						self._qr_frame.pack_forget()
-						self._qr_visible = False
-						return
+					cache_dir = os.path.join(qr_dir, ".cache")
+					for key, name in entries:
+						if token != self._qr_load_token:
+							return
+						if key in self._qr_photo_cache:
+							results.append((key, name, None))
+							continue
+						p, _, target_h = key
+						cache_path = os.path.join(cache_dir, hashlib.sha1(repr(key).encode("utf-8")).hexdigest() + ".png")
+						if os.path.exists(cache_path):
+							img = Image.open(cache_path)
+							img.load()
+						else:
+							img = Image.open(p)
+							w = int(img.width * (target_h / img.height)) if img.height else img.width
+							img = img.resize((w, target_h), Image.LANCZOS)
+							try:
+								os.makedirs(cache_dir, exist_ok=True)
+								img.save(cache_path)
+							except OSError as e:
+								_report("Caching resized QR image failed", e)
+						results.append((key, name, img))
+				except Exception as e:
+					_report("Loading QR images failed", e)
+				if token != self._qr_load_token:
+					return
+				with contextlib.suppress(Exception):
+					self.root.after(0, lambda: _install_qr(results, token))
 
-					import glob
-					from PIL import Image, ImageTk
+			def _install_qr(results, token: int):
+				"""Create the PhotoImages and labels for decoded QR images (Tk thread only)."""
+				try:
+					from PIL import ImageTk
 
-					base_dir = os.path.dirname(os.path.dirname(__file__))
-					qr_dir = os.path.join(base_dir, "qrcodes")
-					png_paths = sorted(glob.glob(os.path.join(qr_dir, "*.png")))
-					if not png_paths:
+					# A later click hid the codes or started a newer load
+					if not results or token != self._qr_load_token:
 						return
-
 					if not getattr(self, "_qr_frame", None):
 						self._qr_frame = tk.Frame(self.root)
 					else:
 						for ch in self._qr_frame.winfo_children():
 							ch.destroy()
 
-					self._qr_images_refs = []
-					for p in png_paths:
+					photos = {}
+					for key, name, img in results:
+						photo = self._qr_photo_cache.get(key)
+						if photo is None:
+							photo = ImageTk.PhotoImage(img)
+						photos[key] = photo
 						sub = tk.Frame(self._qr_frame)
 						sub.pack(side="left", padx=6, pady=4)
-						img = Image.open(p)
-						target_h = 400
-						w = int(img.width * (target_h / img.height)) if img.height else img.width
-						img = img.resize((w, target_h), Image.LANCZOS)
-						photo = ImageTk.PhotoImage(img)
 						lbl = tk.Label(sub, image=photo, bd=0)
 						lbl.pack(side="top")
-						name = os.path.splitext(os.path.basename(p))[0]
 						cap = tk.Label(sub, text=name, anchor="center")
 						cap.pack(side="top", pady=(4, 0))
-						self._qr_images_refs.append(photo)
+					# Keep only images still on disk; this also holds the references Tk needs
+					self._qr_photo_cache = photos
 
 					self._qr_frame.pack(fill="x", padx=8, pady=(4, 4), before=frame)
 					self._qr_visible = True
 				except Exception as e:
 					_report("Toggle QR display failed", e)
 
+			def _toggle_qr_display():
+				try:
+					# Every click supersedes any load still in flight
+					self._qr_load_token += 1
+					token = self._qr_load_token
+					if getattr(self, "_qr_frame", None) and getattr(self, "_qr_visible", False):
+						self._qr_frame.pack_forget()
+						self._qr_visible = False
+						return
+
+					import glob
+
+					base_dir = os.path.dirname(os.path.dirname(__file__))
+					qr_dir = os.path.join(base_dir, "qrcodes")
+					png_paths = sorted(glob.glob(os.path.join(qr_dir, "*.png")))
+					if not png_paths:
+						return
+
+					# Key on mtime so a regenerated QR code is picked up
+					entries = [((p, os.path.getmtime(p), 400), os.path.splitext(os.path.basename(p))[0]) for p in png_paths]
+					if all(key in self._qr_photo_cache for key, _ in entries):
+						_install_qr([(key, name, None) for key, name in entries], token)
+						return
+					threading.Thread(target=_load_qr, args=(qr_dir, entries, token), daemon=True).start()
+				except Exception as e:
+					_report("Toggle QR display failed", e)
+
 			def _open_voice_mix_slider():
 				try:
 					opened = self.player.open_demucs_mix_slider()
-					print(f"Voice mix slider opened: {opened}")
+					log.debug("Voice mix slider opened: %s", opened)
 				except Exception as e:
 					_report("Open voice mix slider failed", e)
 
@@ -346,27 +459,13 @@ class Menu:
 
 			def _vr_on():
 				try:
-					bx = b_vron.winfo_rootx()
-					by = b_vron.winfo_rooty()
-					bw = b_vron.winfo_width()
-					bh = b_vron.winfo_height()
-					btn_center = (bx + bw // 2, by + bh // 2)
-					self.player.perform_vr_on()
-					pyautogui.FAILSAFE = False
-					pyautogui.moveTo(btn_center[0], btn_center[1])
+					_automate_then_return(self._buttons["vron"], self.player.perform_vr_on, "VR ON failed")
 				except Exception as e:
 					_report("VR ON failed", e)
 
 			def _vroff():
 				try:
-					bx = b_vroff.winfo_rootx()
-					by = b_vroff.winfo_rooty()
-					bw = b_vroff.winfo_width()
-					bh = b_vroff.winfo_height()
-					btn_center = (bx + bw // 2, by + bh // 2)
-					self.player.perform_vr_off()
-					pyautogui.FAILSAFE = False
-					pyautogui.moveTo(btn_center[0], btn_center[1])
+					_automate_then_return(self._buttons["vroff"], self.player.perform_vr_off, "VR OFF failed")
 				except Exception as e:
 					_report("VR OFF failed", e)
 
@@ -391,6 +490,7 @@ class Menu:
 					btn_frame_cal.pack(fill="x", pady=8, padx=8)
 
 					capturing = {"active": False}
+					last_pos = {"p": None}
 					steps = []
 					captures = {}
 
@@ -398,8 +498,11 @@ class Menu:
 						if not dlg.winfo_exists():
 							return
 						p = pyautogui.position()
-						pos_lbl.config(text=f"Current mouse: ({p[0]}, {p[1]})")
-						dlg.after(100 if capturing.get("active") else 300, update_pos)
+						# Only touch the label when the pointer actually moved
+						if p != last_pos.get("p"):
+							last_pos["p"] = p
+							pos_lbl.config(text=f"Current mouse: ({p[0]}, {p[1]})")
+						dlg.after(150 if capturing.get("active") else 300, update_pos)
 
 					def start_capture():
 						seq = ["base1", "base2", "spotify_last", "youtube_last", "youtube_extra"]
@@ -452,35 +555,32 @@ class Menu:
 				except Exception as e:
 					_report("Calibrate VR dialog failed", e)
 
-			b_shuffle = tk.Button(btn_frame, text="Shuffle", command=_shuffle_queue, font=btn_font, padx=16, pady=8)
-			b_next = tk.Button(btn_frame, text="Next", command=_next_track, font=btn_font, padx=16, pady=8)
-			b_pause = tk.Button(btn_frame, text="Pause", command=_pause_playback, font=btn_font, padx=12, pady=6)
-			b_refresh = tk.Button(btn_frame, text="Reset Tab", command=_refresh_tab, font=btn_font, padx=12, pady=6)
-			b_reset = tk.Button(btn_frame2, text="Reset VR", command=_reset_vr, font=btn_font, padx=16, pady=8)
-			b_vron = tk.Button(btn_frame2, text="VR ON", command=_vr_on, font=btn_font, padx=16, pady=8)
-			b_vroff = tk.Button(btn_frame2, text="VR OFF", command=_vroff, font=btn_font, padx=16, pady=8)
-			b_calibrate = tk.Button(btn_frame2, text="Calibrate VR", command=_calibrate_vr, font=btn_font, padx=12, pady=6)
-			b_voice_mix = tk.Button(btn_frame2, text="Voice Mix", command=_open_voice_mix_slider, font=btn_font, padx=12, pady=6)
-			b_adder = tk.Button(btn_frame, text="Adder", command=_toggle_adder, font=btn_font, padx=12, pady=6)
-			b_qr = tk.Button(btn_frame, text="QR", command=_toggle_qr_display, font=btn_font, padx=10, pady=4)
-			b_quit = tk.Button(btn_frame, text="Quit", command=_quit_app, font=btn_font, padx=12, pady=6)
-
-			b_shuffle.pack(side="left", padx=8, pady=4)
-			b_next.pack(side="left", padx=8, pady=4)
-			b_pause.pack(side="left", padx=8, pady=4)
-			b_refresh.pack(side="left", padx=8, pady=4)
-			b_reset.pack(in_=btn_frame2, side="left", padx=8, pady=4)
-			b_vron.pack(in_=btn_frame2, side="left", padx=8, pady=4)
-			b_vroff.pack(in_=btn_frame2, side="left", padx=8, pady=4)
-			b_calibrate.pack(in_=btn_frame2, side="left", padx=8, pady=4)
-			b_voice_mix.pack(in_=btn_frame2, side="left", padx=8, pady=4)
-			b_adder.pack(side="right", padx=8, pady=4)
-			b_qr.pack(side="right", padx=8, pady=4)
-			b_quit.pack(side="right", padx=8, pady=4)
+			# (key, text, command, parent, padx, pady, side); list order is pack order within each frame
+			button_specs = [
+				("shuffle", "Shuffle", _shuffle_queue, btn_frame, 16, 8, "left"),
+				("next", "Next", _next_track, btn_frame, 16, 8, "left"),
+				("pause", "Pause", _pause_playback, btn_frame, 12, 6, "left"),
+				("refresh", "Reset Tab", _refresh_tab, btn_frame, 12, 6, "left"),
+				("reset", "Reset VR", _reset_vr, btn_frame2, 16, 8, "left"),
+				("vron", "VR ON", _vr_on, btn_frame2, 16, 8, "left"),
+				("vroff", "VR OFF", _vroff, btn_frame2, 16, 8, "left"),
+				("calibrate", "Calibrate VR", _calibrate_vr, btn_frame2, 12, 6, "left"),
+				("voice_mix", "Voice Mix", _open_voice_mix_slider, btn_frame2, 12, 6, "left"),
+				("adder", "Adder", _toggle_adder, btn_frame, 12, 6, "right"),
+				("qr", "QR", _toggle_qr_display, btn_frame, 10, 4, "right"),
+				("quit", "Quit", _quit_app, btn_frame, 12, 6, "right"),
+			]
+			make_button = tk.Button
+			for key, text, command, parent, padx, pady, side in button_specs:
+				btn = make_button(parent, text=text, command=command, font=btn_font, padx=padx, pady=pady)
+				btn.pack(side=side, padx=8, pady=4)
+				self._buttons[key] = btn
 
 			# Scrolling table for the rest (Treeview for columns)
 			style = ttk.Style()
-			row_h = list_font.metrics("linespace")
+			if Menu._list_row_h is None:
+				Menu._list_row_h = list_font.metrics("linespace")
+			row_h = Menu._list_row_h
 			style.configure("Treeview", font=list_font, rowheight=row_h)
 
 			tree = ttk.Treeview(frame, columns=("idx", "title", "artist", "adder"), show="headings", height=32)
@@ -495,8 +595,22 @@ class Menu:
 			tree.pack(side="left", fill="both", expand=True)
 			vsb.pack(side="right", fill="y")
 			self._tree = tree
-			frame.bind("<Configure>", lambda e: self._reflow_columns(tree, getattr(self.player, "_show_adder_nextup", False)))
-			self.root.bind("<Configure>", lambda e: self._reflow_columns(tree, getattr(self.player, "_show_adder_nextup", False)))
+
+			def _do_reflow():
+				self._reflow_pending = None
+				try:
+					# Size for the columns actually displayed; _render keeps this in step with the toggle
+					self._reflow_columns(tree, bool(self._displayed_adder))
+				except Exception as e:
+					_report("Column reflow failed", e)
+
+			def _on_configure(event=None):
+				# Resizes fire <Configure> in bursts; reflow once per burst window
+				if self._reflow_pending is None:
+					self._reflow_pending = self.root.after(self._min_interval_ms, _do_reflow)
+
+			frame.bind("<Configure>", _on_configure)
+			self.root.bind("<Configure>", _on_configure)
 
 			def _on_tree_button_press(event):
 				try:
@@ -505,20 +619,30 @@ class Menu:
 						return
 					self._dragging = True
 					self._drag_iid = item
+					self._last_over_iid = item
 					tree.selection_set(item)
 				except Exception as e:
 					_report("Tree button press handler failed", e)
 
-			def _on_tree_motion(event):
+			def _process_motion():
+				self._motion_scheduled = False
 				try:
 					if not getattr(self, "_dragging", False):
 						return
-					over = tree.identify_row(event.y)
-					if over:
+					over = tree.identify_row(self._motion_y)
+					if over and over != self._last_over_iid:
+						self._last_over_iid = over
 						tree.selection_set(over)
 				except Exception as e:
 					_report("Tree drag motion handler failed", e)
 
+			def _on_tree_motion(event):
+				# Keep only the latest pointer position and handle it once the event queue drains
+				self._motion_y = event.y
+				if not self._motion_scheduled:
+					self._motion_scheduled = True
+					tree.after_idle(_process_motion)
+
 			def _on_tree_button_release(event):
 				try:
 					if not getattr(self, "_dragging", False):
@@ -528,20 +652,25 @@ class Menu:
 					self._drag_iid = None
 					if from_iid is None:
 						return
+					from_idx = self._iid_to_index.get(from_iid)
+					if from_idx is None:
+						return
 					target = tree.identify_row(event.y)
+					to_idx = self._iid_to_index.get(target) if target else None
+					# Work out the target slot before locking; dropping below the last row appends
+					insert_at = None if to_idx is None else max(0, to_idx)
 					with self.player._playlist_lock:
-						from_idx = int(from_iid) - 1
-						to_idx = int(target) - 1 if target else None
-						if from_idx < 0 or from_idx >= len(self.player._queue):
+						# Read the queue under the lock: load_playlists may rebind it
+						queue = self.player._queue
+						# Re-check bounds: playback may have advanced the queue since the press
+						if from_idx < 0 or from_idx >= len(queue):
 							return
-						item = self.player._queue.pop(from_idx)
-						if to_idx is None:
-							self.player._queue.append(item)
+						item = queue[from_idx]
+						del queue[from_idx]
+						if insert_at is None or insert_at >= len(queue):
+							queue.append(item)
 						else:
-							if from_idx < to_idx:
-								to_idx = max(0, to_idx)
-							insert_at = min(max(0, to_idx), len(self.player._queue))
-							self.player._queue.insert(insert_at, item)
+							queue.insert(insert_at, item)
 					self.player.update_menu_file()
 				except Exception as e:
 					_report("Tree drag release handler failed", e)
@@ -551,11 +680,14 @@ class Menu:
 					item = tree.identify_row(event.y)
 					if not item:
 						return
-					idx = int(item) - 1
+					idx = self._iid_to_index.get(item)
+					if idx is None:
+						return
 					with self.player._playlist_lock:
 						if idx < 0 or idx >= len(self.player._queue):
 							return
-						track = self.player._queue.pop(idx)
+						track = self.player._queue[idx]
+						del self.player._queue[idx]
 					self.player.play_track(track)
 					self.player.update_menu_file()
 				except Exception as e:
@@ -571,20 +703,18 @@ class Menu:
 					if not self._running.is_set():
 						self.root.quit()
 						return
-					with self.player._playlist_lock:
-						q = list(self.player._queue)
-					self.schedule_update(q)
+					# Reschedule first so a failing render can't stop the 1 Hz loop
 					self.root.after(1000, refresh_loop)
+					# Already on the Tk thread: render now rather than arming a second after() timer
+					self._flush_update()
 				except Exception as e:
 					_report("Refresh loop failed", e)
 
-			with self.player._playlist_lock:
-				q = list(self.player._queue)
-			self.schedule_update(q)
+			self.schedule_update()
 
 			self.root.protocol("WM_DELETE_WINDOW", self.stop)
 			self.root.after(1000, refresh_loop)
 			self.root.mainloop()
 		except Exception as e:
-			print(f"[Menu] UI thread crashed: {e}")
+			log.warning("[Menu] UI thread crashed: %s", e)
 			return